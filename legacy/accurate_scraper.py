@@ -6,24 +6,37 @@ Integrates multiple AI models for intelligent search, extraction, and validation
 
 import os
 import sys
+import platform
 import json
 import time
 import random
 import logging
-import requests
+import functools
+import importlib.util
+import threading
+from collections import OrderedDict
+from itertools import chain, cycle, islice
 from bs4 import BeautifulSoup
+import soupsieve
+from selectolax.lexbor import LexborHTMLParser
 from datetime import datetime
 import pandas as pd
-from urllib.parse import quote_plus, urlparse
+import numpy as np
+from urllib.parse import quote_plus, urlparse, urlsplit
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
+import httpx
+import xxhash
+from aiolimiter import AsyncLimiter
+from concurrent.futures import ThreadPoolExecutor
 import urllib3
+from config import Config
 urllib3.disable_warnings()
 
 # AI Libraries
 try:
     import spacy
-    from transformers import pipeline, AutoTokenizer, AutoModelForSequenceClassification
+    from transformers import pipeline
     import torch
     from sentence_transformers import SentenceTransformer
     HAS_AI = True
@@ -47,21 +60,392 @@ try:
 except ImportError:
     HAS_OLLAMA = False
 
+# Optional: orjson for fast JSON serialization
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Optional: Hyperscan for single-pass page keyword scanning
+try:
+    import hyperscan
+    HAS_HYPERSCAN = True
+except ImportError:
+    HAS_HYPERSCAN = False
+
+# Optional: Aho-Corasick automaton for keyword scanning without Hyperscan
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+# Optional: google-re2 for linear-time page scanning (other re2 bindings have a different API)
+try:
+    import re2
+    HAS_RE2 = hasattr(re2, 'Options')
+except ImportError:
+    HAS_RE2 = False
+
+# Optional: pyarrow for compact columnar Parquet export and fast CSV writing
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Optional: XlsxWriter for faster Excel export than openpyxl (pandas imports it, so only check it's there)
+HAS_XLSXWRITER = importlib.util.find_spec('xlsxwriter') is not None
+
+# Optional feature status lines for reports, fixed once the imports above have run
+FEATURE_STATUS = '\n'.join(
+    f"{label}: {available if flag else missing}"
+    for label, flag, available, missing in (
+        ('AI Models', HAS_AI, '✅ Active', '❌ Basic Mode'),
+        ('Phone Library', HAS_PHONENUMBERS, '✅ phonenumbers', '❌ regex only'),
+        ('Local LLM', HAS_OLLAMA, '✅ Ollama', '❌ Not available'),
+    )
+)
+
+# Search query templates used by generate_ai_enhanced_queries
+QUERY_LOCATION_TEMPLATES = (
+    '{q}',
+    '{q} near {loc}',
+    '{q} in {loc}',
+    '{q} {loc} area',
+    'best {q} {loc}',
+    'local {q} {loc}',
+    '{q} services {loc}',
+    'professional {q} {loc}'
+)
+QUERY_MATERIALS = ('copper', 'aluminum', 'steel', 'iron', 'brass')
+QUERY_MATERIAL_TEMPLATES = (
+    '{m} {q} {loc}',
+    '{q} {m} buyers {loc}',
+    '{m} recycling {loc}'
+)
+MAX_ENHANCED_QUERIES = 15
+
+def _compile_keywords(keywords, flags=0):
+    """Compile a keyword list into one alternation regex for a single scan"""
+    return re.compile('|'.join(map(re.escape, keywords)), flags)
+
+# RE2's \s, \d and \w are ASCII-only; these class members keep their Python meaning
+_RE2_CLASS_ESCAPES = {
+    's': r'\s\v\x{1c}-\x{1f}\x{85}\p{Z}',
+    'd': r'\p{Nd}',
+    'w': r'\p{L}\p{N}_',
+}
+
+def _to_re2_syntax(pattern):
+    """Rewrite Python class escapes in a pattern to their Unicode RE2 equivalents"""
+    out = []
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            escape = pattern[i + 1]
+            members = _RE2_CLASS_ESCAPES.get(escape)
+            if members is None:
+                out.append(char + escape)
+            else:
+                out.append(members if in_class else f'[{members}]')
+            i += 2
+            continue
+        if char == '[' and not in_class:
+            in_class = True
+        elif char == ']' and in_class:
+            in_class = False
+        out.append(char)
+        i += 1
+    return ''.join(out)
+
+class _DigitFilter(dict):
+    """str.translate table that keeps decimal digits (what re's \\d matches) and drops the rest"""
+    def __missing__(self, codepoint):
+        kept = codepoint if chr(codepoint).isdecimal() else None
+        self[codepoint] = kept
+        return kept
+
+_KEEP_DIGITS = _DigitFilter()
+
+# \b or \B not preceded by another backslash; RE2 word boundaries only know ASCII word characters,
+# so patterns using them stay on re and bound their repeated runs to keep the scan linear
+_WORD_BOUNDARY = re.compile(r'(?<!\\)(?:\\\\)*\\[bB]')
+
+# Non-ASCII page snippets every RE2-compiled pattern must treat exactly like re
+_RE2_CHECK_SAMPLES = (
+    "Contact: Müller, CA 90210 today",
+    "Schrotthändler Straße 12, 10115 Berlin, Tel. +49 30 1234567, info@schrott-müller.de",
+    "Société Métaux, 12 rue de l'Étoile, 75017 Paris — tél : 01 23 45 67 89",
+    "Złom Łódź ul. Piotrkowska 1, 90-001 Łódź, tel. 42 123 45 67, biuro@złom.pl",
+    "Металлолом Москва, ул. Ленина 5, тел. +7 495 123-45-67, since ١٩٩٨",
+    "São Paulo, SP 01000-000 · Ünïcödé Recycling Ltd · office@exämple.com",
+)
+
+def _compile_scan(pattern, flags=0):
+    """Compile a pattern that scans whole pages, using RE2 when available"""
+    compiled = re.compile(pattern, flags)
+    if HAS_RE2 and not _WORD_BOUNDARY.search(pattern):
+        options = re2.Options()
+        options.case_sensitive = not flags & re.IGNORECASE
+        try:
+            compiled_re2 = re2.compile(_to_re2_syntax(pattern), options)
+        except re2.error:
+            return compiled
+        # A spot check for engine differences the rewrite misses, not a proof of equivalence
+        if all(compiled_re2.findall(sample) == compiled.findall(sample) for sample in _RE2_CHECK_SAMPLES):
+            return compiled_re2
+    return compiled
+
 class AIEnhancedMetalScraper:
+    # Link relevance keyword sets
+    RELEVANT_KEYWORDS = (
+        'scrap', 'metal', 'recycling', 'salvage', 'junk', 'yard',
+        'steel', 'copper', 'aluminum', 'iron', 'brass', 'buyer',
+        'dealer', 'processing', 'facility', 'center', 'company',
+        'auto parts', 'demolition', 'waste', 'materials'
+    )
+    
+    # Exclude obvious non-business sites
+    EXCLUDE_DOMAINS = (
+        'wikipedia.org', 'facebook.com', 'youtube.com', 'linkedin.com',
+        'indeed.com', 'glassdoor.com', 'amazon.com', 'ebay.com',
+        'craigslist.org', 'reddit.com', 'twitter.com', 'instagram.com'
+    )
+    
+    EXCLUDE_KEYWORDS = (
+        'software', 'app', 'game', 'news', 'blog', 'jobs', 'career',
+        'hiring', 'employment', 'resume', 'salary', 'review', 'rating',
+        'price guide', 'calculator', 'directory', 'listing'
+    )
+    
+    BUSINESS_INDICATORS = (
+        'llc', 'inc', 'corp', 'company', 'co.', 'ltd', 'phone',
+        'contact', 'address', 'location', 'hours', 'service'
+    )
+    
+    # Compiled once per class; domains are matched case-insensitively against the raw URL
+    _relevant_re = _compile_keywords(RELEVANT_KEYWORDS)
+    _exclude_domain_re = _compile_keywords(EXCLUDE_DOMAINS, re.IGNORECASE)
+    _exclude_kw_re = _compile_keywords(EXCLUDE_KEYWORDS)
+    _business_indicator_re = _compile_keywords(BUSINESS_INDICATORS)
+    
+    # Fallback relevance check for extracted businesses when no sentence model is loaded
+    BASIC_RELEVANCE_KEYWORDS = (
+        'scrap', 'metal', 'recycling', 'salvage', 'steel', 'aluminum', 'copper', 'iron', 'brass'
+    )
+    _basic_relevance_re = _compile_keywords(BASIC_RELEVANCE_KEYWORDS)
+    
+    US_STATE_CODES = (
+        'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA', 'HI', 'ID', 'IL', 'IN', 'IA',
+        'KS', 'KY', 'LA', 'ME', 'MD', 'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
+        'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC', 'SD', 'TN', 'TX', 'UT', 'VT',
+        'VA', 'WA', 'WV', 'WI', 'WY'
+    )
+    
+    # Phone parts rejected by the simple phone extractor
+    SIMPLE_PHONE_BAD_AREAS = frozenset({'000'})
+    SIMPLE_PHONE_BAD_EXCHANGES = frozenset({'000'})
+    SIMPLE_PHONE_BAD_NUMBERS = frozenset({'0000'})
+    
+    # Placeholder domains rejected by email validation
+    TEST_EMAIL_DOMAINS = frozenset({
+        'example.com', 'test.com', 'sample.com', 'demo.com',
+        'placeholder.com', 'dummy.com', 'fake.com'
+    })
+    
+    # Page keyword families for the services and payment extractors
+    SERVICE_KEYWORDS = (
+        'pickup', 'collection', 'container rental', 'roll-off', 'demolition',
+        'dismantling', 'processing', 'sorting', 'weighing', 'cash payment',
+        'commercial', 'residential', 'industrial', 'certified scales',
+        'licensed', 'insured', 'bonded', 'environmental compliance'
+    )
+    
+    PAYMENT_KEYWORDS = (
+        'cash', 'check', 'credit card', 'debit card', 'visa', 'mastercard',
+        'american express', 'discover', 'paypal', 'wire transfer',
+        'bank transfer', 'financing', 'net terms'
+    )
+    
+    # Target business descriptions for AI link filtering and business validation
+    LINK_TARGET_DESCRIPTION = "scrap metal recycling business that buys and processes metal materials"
+    BUSINESS_TARGET_DESCRIPTION = "scrap metal recycling business"
+    
+    # Fields counted towards a business's data completeness score
+    COMPLETENESS_FIELDS = (
+        'name', 'phone', 'email', 'website', 'address', 'city', 'state',
+        'description', 'materials_accepted', 'services', 'working_hours'
+    )
+    
+    # Columns of the focused Excel export sheets, in sheet order
+    CONTACT_SHEET_COLUMNS = ('name', 'phone', 'email', 'website', 'address', 'city', 'state')
+    AI_SHEET_COLUMNS = ('name', 'ai_relevance_score', 'data_completeness', 'materials_accepted')
+    
+    # Export columns drawn from a small vocabulary, stored as pandas categoricals
+    CATEGORICAL_COLUMNS = ('state', 'country', 'source')
+    
+    # Export formats selectable through Config.OUTPUT_FORMAT, with their log labels
+    EXPORT_FORMATS = {'csv': 'CSV', 'excel': 'Excel', 'json': 'JSON', 'parquet': 'Parquet'}
+    
+    # Extraction patterns compiled once per class instead of on every page
+    _PATTERNS = {
+        # Comprehensive US phone patterns
+        'phone_us': tuple(_compile_scan(p, re.IGNORECASE) for p in (
+            # Standard formats
+            r'\b\(?([2-9][0-9]{2})\)?[-.\s]?([2-9][0-9]{2})[-.\s]?([0-9]{4})\b',
+            r'\b1[-.\s]?\(?([2-9][0-9]{2})\)?[-.\s]?([2-9][0-9]{2})[-.\s]?([0-9]{4})\b',
+            
+            # tel: links
+            r'tel:[\s]*\+?1?[-.\s]?\(?([2-9][0-9]{2})\)?[-.\s]?([2-9][0-9]{2})[-.\s]?([0-9]{4})',
+            
+            # With extensions
+            r'\b\(?([2-9][0-9]{2})\)?[-.\s]?([2-9][0-9]{2})[-.\s]?([0-9]{4})(?:\s*(?:ext|x|extension)\.?\s*\d{1,4})?\b',
+            
+            # International format
+            r'\+1[-.\s]?\(?([2-9][0-9]{2})\)?[-.\s]?([2-9][0-9]{2})[-.\s]?([0-9]{4})\b',
+            
+            # Separated by spaces
+            r'\b([2-9][0-9]{2})\s+([2-9][0-9]{2})\s+([0-9]{4})\b',
+            
+            # Dot separated
+            r'\b([2-9][0-9]{2})\.([2-9][0-9]{2})\.([0-9]{4})\b'
+        )),
+        'phone_simple': tuple(_compile_scan(p) for p in (
+            r'\((\d{3})\)[\s\-]?(\d{3})[\s\-]?(\d{4})',  # (123) 456-7890
+            r'(\d{3})[\s\-\.](\d{3})[\s\-\.](\d{4})',     # 123-456-7890 or 123.456.7890
+            r'(\d{3})\s(\d{3})\s(\d{4})',                 # 123 456 7890
+            r'1[\s\-]?(\d{3})[\s\-]?(\d{3})[\s\-]?(\d{4})', # 1-123-456-7890
+        )),
+        # Every phone pattern needs three digits in a row
+        'digit_run': re.compile(r'\d{3}'),
+        'itemprop_phone': re.compile(r'telephone|phone', re.IGNORECASE),
+        
+        'email': tuple(_compile_scan(p, re.IGNORECASE) for p in (
+            # Standard email
+            r'\b[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]{1,255}\.[A-Z|a-z]{2,63}\b',
+            # With spaces around @
+            r'\b[A-Za-z0-9._%+-]{1,64}\s*@\s*[A-Za-z0-9.-]{1,255}\.[A-Z|a-z]{2,63}\b',
+            # With [at] replacement
+            r'\b[A-Za-z0-9._%+-]{1,64}\s*\[at\]\s*[A-Za-z0-9.-]{1,255}\.[A-Z|a-z]{2,63}\b',
+            # With (at) replacement
+            r'\b[A-Za-z0-9._%+-]{1,64}\s*\(at\)\s*[A-Za-z0-9.-]{1,255}\.[A-Z|a-z]{2,63}\b',
+            # With AT replacement
+            r'\b[A-Za-z0-9._%+-]{1,64}\s*AT\s*[A-Za-z0-9.-]{1,255}\.[A-Z|a-z]{2,63}\b'
+        )),
+        # The five email patterns above factored into one, matching wherever any of them does
+        'email_any': _compile_scan(r'\b[A-Za-z0-9._%+-]{1,64}\s*(?:@|\[at\]|\(at\)|AT)\s*[A-Za-z0-9.-]{1,255}\.[A-Z|a-z]{2,63}\b',
+                                re.IGNORECASE),
+        'email_simple': re.compile(r'[a-zA-Z0-9._%+-]{1,64}@[a-zA-Z0-9.-]{1,255}\.[a-zA-Z]{2,63}'),
+        'email_simple_test_domain': re.compile(r'[@.](?:example|test|sample|placeholder)\.com$'),
+        'email_validate': re.compile(r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}$'),
+        'whitespace': re.compile(r'\s+'),
+        'itemprop_email': re.compile(r'email', re.IGNORECASE),
+        
+        'state_zip': _compile_scan(r'\b(' + '|'.join(US_STATE_CODES) + r')\s*\d{5}(?:-\d{4})?\b'),
+        'itemprop_state': re.compile(r'state|region', re.IGNORECASE),
+        
+        'zip_exact': re.compile(r'^\d{5}(-\d{4})?$'),
+        'zip': (
+            _compile_scan(r'\b(\d{5}(?:-\d{4})?)\b'),  # US ZIP
+            _compile_scan(r'\b([A-Z]\d[A-Z]\s*\d[A-Z]\d)\b')  # Canadian postal code
+        ),
+        'itemprop_zip': re.compile(r'postal|zip', re.IGNORECASE),
+        
+        'address': tuple(_compile_scan(p, re.IGNORECASE) for p in (
+            r'\b\d+\s+[A-Za-z0-9\s]{1,60}(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Boulevard|Blvd|Lane|Ln|Way|Circle|Cir|Court|Ct)\b[^,\n]*',
+            r'\b\d+\s+[A-Za-z0-9\s]{1,60}(?:St|Ave|Rd|Dr|Blvd|Ln|Way|Cir|Ct)\.?\s*[,\n]?[^,\n]*'
+        )),
+        'itemprop_address': re.compile(r'address|street', re.IGNORECASE),
+        
+        'city': tuple(_compile_scan(p, re.IGNORECASE) for p in (
+            r'\b([A-Za-z\s]{1,60}),\s*([A-Z]{2})\s*\d{5}',
+            r'(?:City|Town|Village):\s*([A-Za-z\s]+)',
+            r'Located in ([A-Za-z\s]+),\s*[A-Z]{2}'
+        )),
+        'itemprop_city': re.compile(r'city|locality', re.IGNORECASE),
+        
+        'itemprop_hours': re.compile(r'openingHours|hours', re.IGNORECASE),
+        
+        'certifications': tuple(_compile_scan(p, re.IGNORECASE) for p in (
+            r'ISO\s*\d{4,5}',
+            r'R2\s*certified',
+            r'EPA\s*registered',
+            r'ISRI\s*member',
+            r'certified\s+\w+',
+            r'licensed\s+\w+',
+            r'OSHA\s*compliant'
+        )),
+        'social': {network: _compile_scan(p, re.IGNORECASE) for network, p in (
+            ('facebook', r'(?:facebook\.com|fb\.com)/([^/\s]+)'),
+            ('twitter', r'(?:twitter\.com|x\.com)/([^/\s]+)'),
+            ('instagram', r'instagram\.com/([^/\s]+)'),
+            ('linkedin', r'linkedin\.com/company/([^/\s]+)'),
+            ('youtube', r'youtube\.com/(?:channel|user)/([^/\s]+)'),
+            ('tiktok', r'tiktok\.com/@([^/\s]+)')
+        )},
+        'years': tuple(_compile_scan(p, re.IGNORECASE) for p in (
+            r'(\d{1,2})\s*\+?\s*years?\s+(?:in\s+)?business',
+            r'established\s+(?:in\s+)?(\d{4})',
+            r'since\s+(\d{4})',
+            r'founded\s+(?:in\s+)?(\d{4})',
+            r'serving\s+(?:for\s+)?(\d{1,2})\s*years?'
+        )),
+        'languages': tuple(_compile_scan(p, re.IGNORECASE) for p in (
+            r'languages?\s*:?\s*([^.]+)',
+            r'(?:we\s+)?speak\s+([^.]+)',
+            r'bilingual\s+([^.]+)',
+            r'(?:english|spanish|french|german|italian|chinese|korean|japanese|arabic|russian)',
+        )),
+        'additional_info': tuple(_compile_scan(p, re.IGNORECASE) for p in (
+            r'(?:we\s+also|additionally|other\s+services)\s*:?\s*([^.]+)',
+            r'specializing\s+in\s+([^.]+)',
+            r'expertise\s+in\s+([^.]+)',
+            r'focus\s+on\s+([^.]+)'
+        )),
+    }
+
+    # CSS selectors compiled once; soupsieve matches them without a Python callback per tag
+    _SELECTORS = {
+        'tel_links': soupsieve.compile('a[href^="tel:"]'),
+        'mailto_links': soupsieve.compile('a[href^="mailto:"]'),
+        'phone_class': soupsieve.compile('[class*="phone" i], [class*="tel" i], [class*="contact" i]'),
+        'hours': tuple(soupsieve.compile(selector) for selector in (
+            '.hours', '.opening-hours', '.business-hours', '.working-hours'
+        )),
+        'about': tuple(soupsieve.compile(selector) for selector in (
+            '.about', '.description', '.overview', '.intro', '.summary'
+        )),
+    }
+
     def __init__(self):
-        self.session = requests.Session()
+        self.default_headers = {}
         self.results = []
         self.processed_urls = set()
+        self._seen_pages = set()
+        self._seen_content = set()
         self.logger = self._setup_logging()
         
         # Enhanced settings
         self.TIMEOUT = 8
         self.MAX_WORKERS = 12
-        self.BATCH_SIZE = 25
+        self.MAX_CONNECTIONS = 200
+        self.BATCH_SIZE = 150
         self.TARGET_SUCCESS_RATE = 0.40
+        self.ONNX_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'scraper_onnx')
+        self.STREAM_FILE = os.path.join('output', 'ai_enhanced_results_stream.jsonl')
+        self._sink = None
+        self.EMBEDDING_CACHE_SIZE = 50_000
+        self._embedding_cache = OrderedDict()
+        self._rate_limits = {}
         
         # AI Models initialization
         self.ai_models = {}
+        self._ner_lock = threading.Lock()
         self._init_ai_models()
         
         # Enhanced search queries with AI-generated variations
@@ -110,6 +494,18 @@ class AIEnhancedMetalScraper:
             'HMS', 'heavy melting scrap', 'auto parts', 'engines', 'transmissions'
         ]
         
+        # All page keyword families, scanned together once per page
+        self._keyword_families = {
+            'materials': tuple(self.material_keywords),
+            'services': self.SERVICE_KEYWORDS,
+            'payment': self.PAYMENT_KEYWORDS
+        }
+        self._keyword_ids = [(family, keyword) for family, keywords in self._keyword_families.items()
+                             for keyword in keywords]
+        self._keyword_db = self._build_keyword_db()
+        self._keyword_automaton = self._build_keyword_automaton() if self._keyword_db is None else None
+        self._scratch = threading.local()
+        
         self.user_agents = [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:122.0) Gecko/20100101 Firefox/122.0',
@@ -117,7 +513,7 @@ class AIEnhancedMetalScraper:
             'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36'
         ]
         
-        self._init_session()
+        self._init_headers()
 
     def _init_ai_models(self):
         """Initialize AI models for enhanced processing"""
@@ -136,44 +532,89 @@ class AIEnhancedMetalScraper:
             
             # Initialize sentence transformer for similarity
             try:
-                self.sentence_model = SentenceTransformer('all-MiniLM-L6-v2')
+                self.sentence_model = self._load_sentence_model()
+                # The relevance targets never change, so embed them once
+                self._link_target_emb, self._business_target_emb = self.sentence_model.encode(
+                    [self.LINK_TARGET_DESCRIPTION, self.BUSINESS_TARGET_DESCRIPTION],
+                    normalize_embeddings=True
+                )
                 self.logger.info("✅ Sentence transformer loaded successfully")
             except Exception as e:
                 self.logger.warning(f"Failed to load sentence transformer: {e}")
                 self.sentence_model = None
             
-            # Initialize text classification for business relevance
-            try:
-                self.classifier = pipeline("text-classification", 
-                                         model="microsoft/DialoGPT-medium",
-                                         return_all_scores=True)
-                self.logger.info("✅ Text classifier loaded successfully")
-            except Exception as e:
-                self.logger.warning(f"Failed to load text classifier: {e}")
-                self.classifier = None
+        except Exception as e:
+            self.logger.error(f"Error initializing AI models: {e}")
+            self.ai_models = {}
+
+    @functools.cached_property
+    def ner_pipeline(self):
+        """NER pipeline, loaded on first use by the AI extraction fallbacks"""
+        if not HAS_AI:
+            return None
+        
+        with self._ner_lock:
+            # Another worker thread may have finished loading while we waited
+            if 'ner_pipeline' in self.__dict__:
+                return self.__dict__['ner_pipeline']
             
-            # Initialize NER pipeline
+            ner = None
             try:
-                self.ner_pipeline = pipeline("ner", 
-                                           model="dbmdz/bert-large-cased-finetuned-conll03-english",
-                                           aggregation_strategy="simple")
+                ner = pipeline("ner",
+                               model="dslim/bert-base-NER",
+                               aggregation_strategy="simple")
                 self.logger.info("✅ NER pipeline loaded successfully")
             except Exception as e:
                 self.logger.warning(f"Failed to load NER pipeline: {e}")
-                self.ner_pipeline = None
             
+            self.__dict__['ner_pipeline'] = ner
+            return ner
+
+    def _ner_entities(self, text):
+        """NER entities for the start of a page, computed once per page and worker thread"""
+        # Every AI fallback for a page gets the same page_text object
+        scratch = self._scratch
+        if getattr(scratch, 'ner_text', None) is not text:
+            scratch.ner_entities = self.ner_pipeline(text[:1000])  # Limit text length
+            scratch.ner_text = text
+        return scratch.ner_entities
+
+    def _load_sentence_model(self):
+        """Load MiniLM in fp16 on a CUDA GPU, otherwise int8 on ONNX Runtime or PyTorch"""
+        # Relevance thresholds are coarse, so half precision is plenty on tensor cores
+        if torch.cuda.is_available():
+            model = SentenceTransformer('all-MiniLM-L6-v2', device='cuda').half()
+            self.logger.info("✅ Sentence transformer using fp16 on CUDA")
+            return model
+        
+        torch.set_num_threads(os.cpu_count() or 1)
+        
+        # Pre-quantized graphs published alongside the model
+        if platform.machine().lower() in ('arm64', 'aarch64'):
+            onnx_file = 'onnx/model_qint8_arm64.onnx'
+        else:
+            onnx_file = 'onnx/model_qint8_avx512_vnni.onnx'
+        
+        try:
+            # Exported graph is cached on disk so later runs skip the conversion
+            model = SentenceTransformer('all-MiniLM-L6-v2', backend='onnx',
+                                        cache_folder=self.ONNX_CACHE_DIR,
+                                        model_kwargs={'file_name': onnx_file})
+            self.logger.info("✅ Sentence transformer using int8 ONNX Runtime")
+            return model
         except Exception as e:
-            self.logger.error(f"Error initializing AI models: {e}")
-            self.ai_models = {}
+            self.logger.debug(f"ONNX backend unavailable, using PyTorch: {e}")
+        
+        model = SentenceTransformer('all-MiniLM-L6-v2', device='cpu')
+        return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
 
-    def _init_session(self):
-        """Initialize session with enhanced headers"""
-        self.session.headers.update({
+    def _init_headers(self):
+        """Initialize default client headers"""
+        self.default_headers.update({
             'User-Agent': random.choice(self.user_agents),
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
             'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
             'Sec-Fetch-Dest': 'document',
             'Sec-Fetch-Mode': 'navigate',
@@ -181,6 +622,20 @@ class AIEnhancedMetalScraper:
             'Cache-Control': 'max-age=0',
             'DNT': '1'
         })
+        
+        # Per-request header variants, built once and rotated instead of rebuilt per request.
+        # All requests are issued from the event loop thread, so the cycles need no locking.
+        request_headers = {
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.9',
+            'Accept-Encoding': 'gzip, deflate'
+        }
+        referers = {'google': 'https://www.google.com/', 'bing': 'https://www.bing.com/'}
+        self._header_cycles = {
+            name: cycle([dict(request_headers, **{'User-Agent': ua, 'Referer': referer})
+                         for ua in self.user_agents])
+            for name, referer in referers.items()
+        }
 
     def _setup_logging(self):
         logger = logging.getLogger('AIEnhancedMetalScraper')
@@ -196,37 +651,24 @@ class AIEnhancedMetalScraper:
 
     def generate_ai_enhanced_queries(self, base_query, location):
         """Generate enhanced search queries using AI"""
-        enhanced_queries = [base_query]
-        
-        # Add location-specific variations
-        enhanced_queries.extend([
-            f"{base_query} near {location}",
-            f"{base_query} in {location}",
-            f"{base_query} {location} area",
-            f"best {base_query} {location}",
-            f"local {base_query} {location}",
-            f"{base_query} services {location}",
-            f"professional {base_query} {location}"
-        ])
-        
-        # Add material-specific variations
-        materials = ['copper', 'aluminum', 'steel', 'iron', 'brass']
-        for material in materials:
-            enhanced_queries.extend([
-                f"{material} {base_query} {location}",
-                f"{base_query} {material} buyers {location}",
-                f"{material} recycling {location}"
-            ])
-        
-        # Use local LLM if available for query generation
-        if HAS_OLLAMA:
+        queries = chain(
+            # Location-specific variations
+            (template.format(q=base_query, loc=location) for template in QUERY_LOCATION_TEMPLATES),
+            # Material-specific variations
+            (template.format(m=material, q=base_query, loc=location)
+             for material in QUERY_MATERIALS for template in QUERY_MATERIAL_TEMPLATES)
+        )
+        enhanced_queries = list(islice(queries, MAX_ENHANCED_QUERIES))
+        
+        # Use local LLM if available for query generation; only worth it while under the limit
+        if HAS_OLLAMA and len(enhanced_queries) < MAX_ENHANCED_QUERIES:
             try:
                 ai_queries = self._generate_queries_with_ollama(base_query, location)
                 enhanced_queries.extend(ai_queries)
             except Exception as e:
                 self.logger.debug(f"Ollama query generation failed: {e}")
         
-        return enhanced_queries[:15]  # Limit to prevent too many queries
+        return enhanced_queries[:MAX_ENHANCED_QUERIES]  # Limit to prevent too many queries
 
     def _generate_queries_with_ollama(self, base_query, location):
         """Generate search queries using local LLM"""
@@ -262,9 +704,13 @@ class AIEnhancedMetalScraper:
         all_links = self._collect_ai_enhanced_links()
         self.logger.info(f"✅ Collected {len(all_links)} unique links")
         
-        # Phase 2: Comprehensive Data Extraction
+        # Phase 2: Comprehensive Data Extraction, streamed to JSONL as businesses are found
         self.logger.info("📊 Phase 2: Comprehensive Data Extraction")
-        businesses = self._extract_comprehensive_data(all_links, target_businesses)
+        os.makedirs(os.path.dirname(self.STREAM_FILE), exist_ok=True)
+        with open(self.STREAM_FILE, 'ab') as self._sink:
+            businesses = self._extract_comprehensive_data(all_links, target_businesses)
+        self._sink = None
+        self.logger.info(f"💾 Streamed extracted businesses to {self.STREAM_FILE}")
         
         # Phase 3: AI-Enhanced Data Validation
         self.logger.info("🧠 Phase 3: AI-Enhanced Data Validation")
@@ -283,10 +729,51 @@ class AIEnhancedMetalScraper:
         
         return self.results
 
+    def _run_async(self, coro):
+        """Run a pipeline coroutine with HTML parsing offloaded to a MAX_WORKERS thread pool"""
+        async def runner():
+            asyncio.get_running_loop().set_default_executor(
+                ThreadPoolExecutor(max_workers=self.MAX_WORKERS)
+            )
+            return await coro
+
+        return asyncio.run(runner())
+
+    def _create_async_client(self):
+        """Create the shared async HTTP/2 client for a pipeline phase"""
+        return httpx.AsyncClient(
+            http2=True,
+            headers=self.default_headers,
+            limits=httpx.Limits(max_connections=self.MAX_CONNECTIONS,
+                                max_keepalive_connections=100),
+            timeout=self.TIMEOUT,
+            verify=False,
+            follow_redirects=True
+        )
+
+    async def _async_fetch(self, client, url, headers):
+        """Fetch a URL without blocking the event loop"""
+        try:
+            return await client.get(url, headers=headers)
+        except Exception as e:
+            self.logger.debug(f"Request failed for {url}: {e}")
+            return None
+
     def _collect_ai_enhanced_links(self):
         """Collect links with AI-enhanced search strategies"""
+        return self._run_async(self._collect_ai_enhanced_links_async())
+
+    async def _collect_ai_enhanced_links_async(self):
+        """Run search tasks concurrently in chunks and AI-filter each chunk as one batch"""
         all_links = []
         
+        # Per-origin token buckets: Google 2 req/s (burst 5), Bing 4 req/s (burst 10).
+        # Limiters are bound to the running event loop, so they are created per run.
+        self._rate_limits = {
+            'google': AsyncLimiter(5, 2.5),
+            'bing': AsyncLimiter(10, 2.5)
+        }
+        
         # Use top locations for comprehensive coverage
         selected_locations = self.us_locations[:20]  # Top 20 cities
         
@@ -301,55 +788,82 @@ class AIEnhancedMetalScraper:
         
         self.logger.info(f"📋 Generated {len(search_tasks)} AI-enhanced search tasks")
         
-        # Execute searches in parallel
-        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+        # Execute searches concurrently
+        async with self._create_async_client() as client:
             for i in range(0, len(search_tasks), self.BATCH_SIZE):
                 batch = search_tasks[i:i + self.BATCH_SIZE]
-                batch_links = []
                 
-                futures = {
-                    executor.submit(self._enhanced_search, query, page, location): (query, page, location)
-                    for query, page, location in batch
-                }
+                results = await asyncio.gather(
+                    *(self._enhanced_search(client, query, page, location) for query, page, location in batch),
+                    return_exceptions=True
+                )
                 
-                for future in as_completed(futures, timeout=60):
-                    try:
-                        links = future.result(timeout=10)
-                        if links:
-                            # Use AI to filter relevant links
-                            relevant_links = self._filter_links_with_ai(links)
-                            batch_links.extend(relevant_links)
-                    except Exception as e:
-                        self.logger.debug(f"Search batch failed: {e}")
-                        continue
+                candidate_links = []
+                for result in results:
+                    if isinstance(result, Exception):
+                        self.logger.debug(f"Search batch failed: {result}")
+                    elif result:
+                        candidate_links.extend(result)
                 
+                # Use AI to filter relevant links
+                batch_links = self._filter_links_with_ai(candidate_links) if candidate_links else []
                 all_links.extend(batch_links)
                 
-                progress = (i + self.BATCH_SIZE) / len(search_tasks) * 100
+                progress = min(i + self.BATCH_SIZE, len(search_tasks)) / len(search_tasks) * 100
                 self.logger.info(f"📊 Batch {i//self.BATCH_SIZE + 1}: +{len(batch_links)} links | Total: {len(all_links)} | Progress: {progress:.1f}%")
                 
                 # Collect sufficient links
                 if len(all_links) >= 800:
                     break
         
-        return self._deduplicate_links(all_links)
+        return all_links
 
-    def _enhanced_search(self, query, page, location):
+    async def _enhanced_search(self, client, query, page, location):
         """Enhanced search with multiple engines"""
         links = []
         
         # Try Google first
-        google_links = self._google_search(query, page)
+        google_links = await self._google_search(client, query, page)
         links.extend(google_links)
         
         # Try Bing as fallback
         if len(links) < 5:
-            bing_links = self._bing_search(query, page)
+            bing_links = await self._bing_search(client, query, page)
             links.extend(bing_links)
         
-        return links
+        # Drop URLs seen in earlier results so they never reach the AI filter
+        return self._filter_new_links(links)
+
+    @staticmethod
+    def _canonical_url(url):
+        """Normalize a URL for duplicate detection"""
+        return urlsplit(url)._replace(query='', fragment='').geturl().lower().rstrip('/')
+
+    def _filter_new_links(self, links):
+        """Keep only links whose canonical URL, or domain and title, has not been collected yet"""
+        new_links = []
+        for link in links:
+            canonical = self._canonical_url(link['url'])
+            key = xxhash.xxh3_64_intdigest(canonical.encode())
+            if key in self.processed_urls:
+                continue
+            
+            # The same storefront is often reachable under several paths of one domain
+            title = link['title'].strip().lower()
+            page_key = None
+            if title:
+                domain = urlsplit(canonical).netloc.removeprefix('www.')
+                page_key = xxhash.xxh3_64_intdigest(f"{domain}\n{title}".encode())
+            if page_key in self._seen_pages:
+                continue
+            
+            self.processed_urls.add(key)
+            if page_key:
+                self._seen_pages.add(page_key)
+            new_links.append(link)
+        return new_links
 
-    def _google_search(self, query, page):
+    async def _google_search(self, client, query, page):
         """Enhanced Google search"""
         links = []
         
@@ -357,66 +871,64 @@ class AIEnhancedMetalScraper:
             start = (page - 1) * 10
             url = f"https://www.google.com/search?q={quote_plus(query)}&start={start}&num=10"
             
-            headers = {
-                'User-Agent': random.choice(self.user_agents),
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive',
-                'Referer': 'https://www.google.com/'
-            }
-            
-            response = self.session.get(url, headers=headers, timeout=self.TIMEOUT, verify=False)
+            await self._rate_limits['google'].acquire()
+            response = await client.get(url, headers=next(self._header_cycles['google']))
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Enhanced Google result parsing
-                results = soup.find_all('div', class_='g')
-                
-                for result in results:
-                    try:
-                        # Extract link
-                        link_elem = result.find('a', href=True)
-                        if not link_elem:
-                            continue
-                        
-                        url = link_elem['href']
-                        if not url.startswith('http'):
-                            continue
-                        
-                        # Extract title
-                        title_elem = result.find('h3')
-                        title = title_elem.get_text(strip=True) if title_elem else ""
-                        
-                        # Extract description
-                        desc_elem = result.find('span', class_='st') or result.find('div', class_='s')
-                        description = desc_elem.get_text(strip=True) if desc_elem else ""
-                        
-                        if self._is_business_relevant(title, url, description):
-                            links.append({
-                                'url': url,
-                                'title': title,
-                                'description': description,
-                                'page': page,
-                                'query': query,
-                                'source': 'Google'
-                            })
-                        
-                        if len(links) >= 15:
-                            break
-                            
-                    except Exception as e:
-                        continue
-            
-            time.sleep(random.uniform(1.0, 2.0))
+                loop = asyncio.get_running_loop()
+                links = await loop.run_in_executor(None, self._parse_google_results, response.content, query, page)
             
         except Exception as e:
             self.logger.debug(f"Google search failed for '{query}' page {page}: {e}")
         
         return links
 
-    def _bing_search(self, query, page):
+    def _parse_google_results(self, content, query, page):
+        """Parse relevant business links from a Google results page"""
+        links = []
+        tree = LexborHTMLParser(content)
+        
+        # Enhanced Google result parsing
+        results = tree.css('div.g')
+        
+        for result in results:
+            try:
+                # Extract link
+                link_elem = result.css_first('a[href]')
+                if not link_elem:
+                    continue
+                
+                url = link_elem.attributes['href']
+                if not url.startswith('http'):
+                    continue
+                
+                # Extract title
+                title_elem = result.css_first('h3')
+                title = title_elem.text(strip=True) if title_elem else ""
+                
+                # Extract description
+                desc_elem = result.css_first('span.st') or result.css_first('div.s')
+                description = desc_elem.text(strip=True) if desc_elem else ""
+                
+                if self._is_business_relevant(title, url, description):
+                    links.append({
+                        'url': url,
+                        'title': title,
+                        'description': description,
+                        'page': page,
+                        'query': query,
+                        'source': 'Google'
+                    })
+                
+                if len(links) >= 15:
+                    break
+                    
+            except Exception as e:
+                continue
+        
+        return links
+
+    async def _bing_search(self, client, query, page):
         """Enhanced Bing search as fallback"""
         links = []
         
@@ -424,96 +936,69 @@ class AIEnhancedMetalScraper:
             start = (page - 1) * 10
             url = f"https://www.bing.com/search?q={quote_plus(query)}&first={start}&count=10"
             
-            headers = {
-                'User-Agent': random.choice(self.user_agents),
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive',
-                'Referer': 'https://www.bing.com/'
-            }
-            
-            response = self.session.get(url, headers=headers, timeout=self.TIMEOUT, verify=False)
+            await self._rate_limits['bing'].acquire()
+            response = await client.get(url, headers=next(self._header_cycles['bing']))
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                results = soup.find_all('li', class_='b_algo')
-                
-                for result in results:
-                    try:
-                        h2 = result.find('h2')
-                        if not h2:
-                            continue
-                        
-                        link_elem = h2.find('a', href=True)
-                        if not link_elem:
-                            continue
-                        
-                        url = link_elem['href']
-                        title = h2.get_text(strip=True)
-                        
-                        desc_elem = result.find('p') or result.find('div', class_='b_caption')
-                        description = desc_elem.get_text(strip=True)[:200] if desc_elem else ""
-                        
-                        if self._is_business_relevant(title, url, description):
-                            links.append({
-                                'url': url,
-                                'title': title,
-                                'description': description,
-                                'page': page,
-                                'query': query,
-                                'source': 'Bing'
-                            })
-                        
-                        if len(links) >= 12:
-                            break
-                            
-                    except Exception as e:
-                        continue
-            
-            time.sleep(random.uniform(0.8, 1.5))
+                loop = asyncio.get_running_loop()
+                links = await loop.run_in_executor(None, self._parse_bing_results, response.content, query, page)
             
         except Exception as e:
             self.logger.debug(f"Bing search failed for '{query}' page {page}: {e}")
         
         return links
 
-    def _is_business_relevant(self, title, url, description):
-        """Enhanced business relevance check"""
-        # Basic keyword check
-        relevant_keywords = [
-            'scrap', 'metal', 'recycling', 'salvage', 'junk', 'yard',
-            'steel', 'copper', 'aluminum', 'iron', 'brass', 'buyer',
-            'dealer', 'processing', 'facility', 'center', 'company',
-            'auto parts', 'demolition', 'waste', 'materials'
-        ]
-        
-        # Exclude obvious non-business sites
-        exclude_domains = [
-            'wikipedia.org', 'facebook.com', 'youtube.com', 'linkedin.com',
-            'indeed.com', 'glassdoor.com', 'amazon.com', 'ebay.com',
-            'craigslist.org', 'reddit.com', 'twitter.com', 'instagram.com'
-        ]
+    def _parse_bing_results(self, content, query, page):
+        """Parse relevant business links from a Bing results page"""
+        links = []
+        tree = LexborHTMLParser(content)
+        results = tree.css('li.b_algo')
         
-        exclude_keywords = [
-            'software', 'app', 'game', 'news', 'blog', 'jobs', 'career',
-            'hiring', 'employment', 'resume', 'salary', 'review', 'rating',
-            'price guide', 'calculator', 'directory', 'listing'
-        ]
+        for result in results:
+            try:
+                h2 = result.css_first('h2')
+                if not h2:
+                    continue
+                
+                link_elem = h2.css_first('a[href]')
+                if not link_elem:
+                    continue
+                
+                url = link_elem.attributes['href']
+                title = h2.text(strip=True)
+                
+                desc_elem = result.css_first('p') or result.css_first('div.b_caption')
+                description = desc_elem.text(strip=True)[:200] if desc_elem else ""
+                
+                if self._is_business_relevant(title, url, description):
+                    links.append({
+                        'url': url,
+                        'title': title,
+                        'description': description,
+                        'page': page,
+                        'query': query,
+                        'source': 'Bing'
+                    })
+                
+                if len(links) >= 12:
+                    break
+                    
+            except Exception as e:
+                continue
         
+        return links
+
+    def _is_business_relevant(self, title, url, description):
+        """Enhanced business relevance check"""
         combined_text = f"{title} {url} {description}".lower()
         
         # Check relevance
-        relevant_count = sum(1 for word in relevant_keywords if word in combined_text)
-        has_exclude_domain = any(domain in url.lower() for domain in exclude_domains)
-        has_exclude_word = any(word in combined_text for word in exclude_keywords)
+        relevant_count = len(set(self._relevant_re.findall(combined_text)))
+        has_exclude_domain = bool(self._exclude_domain_re.search(url))
+        has_exclude_word = bool(self._exclude_kw_re.search(combined_text))
         
         # Business indicators
-        business_indicators = [
-            'llc', 'inc', 'corp', 'company', 'co.', 'ltd', 'phone',
-            'contact', 'address', 'location', 'hours', 'service'
-        ]
-        has_business_indicators = any(indicator in combined_text for indicator in business_indicators)
+        has_business_indicators = bool(self._business_indicator_re.search(combined_text))
         
         return (relevant_count >= 2 and not has_exclude_domain and
                 not has_exclude_word and has_business_indicators)
@@ -524,23 +1009,13 @@ class AIEnhancedMetalScraper:
             return links
         
         try:
-            # Define target business description
-            target_description = "scrap metal recycling business that buys and processes metal materials"
+            # Encode the whole batch at once; on unit vectors cosine similarity is a plain dot product
+            texts = [f"{link['title']} {link['description']}" for link in links]
+            link_embeddings = self._embed_texts(texts)
+            similarities = link_embeddings @ self._link_target_emb
             
             relevant_links = []
-            
-            for link in links:
-                combined_text = f"{link['title']} {link['description']}"
-                
-                # Use sentence similarity
-                link_embedding = self.sentence_model.encode([combined_text])
-                target_embedding = self.sentence_model.encode([target_description])
-                
-                similarity = torch.cosine_similarity(
-                    torch.tensor(link_embedding),
-                    torch.tensor(target_embedding)
-                )[0].item()
-                
+            for link, similarity in zip(links, similarities.tolist()):
                 if similarity > 0.3:  # Threshold for relevance
                     link['ai_relevance_score'] = similarity
                     relevant_links.append(link)
@@ -553,66 +1028,94 @@ class AIEnhancedMetalScraper:
             self.logger.debug(f"AI filtering failed: {e}")
             return links
 
+    def _embed_texts(self, texts):
+        """Normalized embeddings for texts, encoding only those not seen in earlier batches"""
+        cache = self._embedding_cache
+        misses = list(dict.fromkeys(text for text in texts if text not in cache))
+        
+        if misses:
+            embeddings = self.sentence_model.encode(misses, batch_size=64, convert_to_numpy=True,
+                                                    normalize_embeddings=True)
+            cache.update(zip(misses, embeddings))
+        
+        for text in texts:
+            cache.move_to_end(text)
+        result = np.stack([cache[text] for text in texts])
+        
+        # Evict least recently used embeddings once the cache is full
+        while len(cache) > self.EMBEDDING_CACHE_SIZE:
+            cache.popitem(last=False)
+        
+        return result
+
     def _extract_comprehensive_data(self, links, target_businesses):
         """Extract comprehensive business data with AI enhancement"""
         self.logger.info(f"📊 Extracting comprehensive data from {len(links)} links")
-        
+        return self._run_async(self._extract_comprehensive_data_async(links, target_businesses))
+
+    async def _extract_comprehensive_data_async(self, links, target_businesses):
+        """Fetch business pages concurrently in chunks until the target is reached"""
         businesses = []
         processed_count = 0
         
-        # Process links in parallel
-        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
-            futures = {
-                executor.submit(self._extract_single_business, link): link
-                for link in links
-            }
-            
-            for future in as_completed(futures):
+        async with self._create_async_client() as client:
+            for i in range(0, len(links), self.BATCH_SIZE):
                 if len(businesses) >= target_businesses:
                     break
                 
-                try:
-                    business = future.result(timeout=15)
-                    if business:
+                batch = links[i:i + self.BATCH_SIZE]
+                results = await asyncio.gather(
+                    *(self._extract_single_business_async(client, link) for link in batch),
+                    return_exceptions=True
+                )
+                
+                for business in results:
+                    processed_count += 1
+                    
+                    if isinstance(business, Exception):
+                        self.logger.debug(f"Business extraction failed: {business}")
+                        continue
+                    
+                    if business and len(businesses) < target_businesses:
                         businesses.append(business)
+                        self._stream_business(business)
                         self.logger.info(f"✅ [{len(businesses)}] {business['name'][:50]}... | 📞 {business.get('phone', 'N/A')} | 📧 {business.get('email', 'N/A')}")
-                except Exception as e:
-                    self.logger.debug(f"Business extraction failed: {e}")
-                
-                processed_count += 1
                 
-                if processed_count % 100 == 0:
-                    success_rate = (len(businesses) / processed_count) * 100
-                    self.logger.info(f"📊 Processed: {processed_count} | Found: {len(businesses)} | Success: {success_rate:.1f}%")
+                success_rate = (len(businesses) / processed_count) * 100
+                self.logger.info(f"📊 Processed: {processed_count} | Found: {len(businesses)} | Success: {success_rate:.1f}%")
         
         return businesses
 
-    def _extract_single_business(self, link_data):
-        """Extract comprehensive data from a single business page"""
+    async def _extract_single_business_async(self, client, link_data):
+        """Fetch a business page and parse it off the event loop"""
+        response = await self._async_fetch(client, link_data['url'], next(self._header_cycles['google']))
+        
+        if response is None or response.status_code != 200:
+            return None
+        
+        # Different URLs (redirects, tracking paths) often serve the same page
+        content_key = xxhash.xxh3_128_intdigest(response.content[:65536])
+        if content_key in self._seen_content:
+            return None
+        self._seen_content.add(content_key)
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._extract_single_business, link_data, response)
+
+    def _extract_single_business(self, link_data, response):
+        """Extract comprehensive data from a fetched business page"""
         url = link_data['url']
         
         try:
-            headers = {
-                'User-Agent': random.choice(self.user_agents),
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive',
-                'Referer': 'https://www.google.com/'
-            }
-            
-            response = self.session.get(url, headers=headers, timeout=self.TIMEOUT, verify=False)
-            
-            if response.status_code != 200:
-                return None
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             page_text = response.text
+            keywords = self._find_keywords(page_text.lower())
+            microdata = self._build_microdata_index(soup)
             
             # Extract comprehensive business data
             name = self._extract_business_name(link_data, soup)
-            phone = self._extract_phone_enhanced(page_text, soup)
-            email = self._extract_email_enhanced(page_text, soup)
+            phone = self._extract_phone_enhanced(page_text, soup, microdata)
+            email = self._extract_email_enhanced(page_text, soup, microdata)
             
             # Debug logging
             self.logger.debug(f"Extracting from {url[:50]}...")
@@ -625,16 +1128,16 @@ class AIEnhancedMetalScraper:
                 'phone': phone,
                 'email': email,
                 'website': url,
-                'address': self._extract_address_enhanced(page_text, soup),
-                'city': self._extract_city_enhanced(page_text, soup),
-                'state': self._extract_state_enhanced(page_text, soup),
-                'zip_code': self._extract_zip_enhanced(page_text, soup),
+                'address': self._extract_address_enhanced(page_text, soup, microdata),
+                'city': self._extract_city_enhanced(page_text, soup, microdata),
+                'state': self._extract_state_enhanced(page_text, soup, microdata),
+                'zip_code': self._extract_zip_enhanced(page_text, soup, microdata),
                 'country': 'United States',
                 'description': self._extract_description_enhanced(page_text, soup),
-                'materials_accepted': self._extract_materials_enhanced(page_text, soup),
-                'services': self._extract_services_enhanced(page_text, soup),
-                'working_hours': self._extract_hours_enhanced(page_text, soup),
-                'payment_methods': self._extract_payment_methods_enhanced(page_text, soup),
+                'materials_accepted': self._extract_materials_enhanced(page_text, soup, keywords),
+                'services': self._extract_services_enhanced(page_text, soup, keywords),
+                'working_hours': self._extract_hours_enhanced(page_text, soup, microdata),
+                'payment_methods': self._extract_payment_methods_enhanced(page_text, soup, keywords),
                 'certifications': self._extract_certifications_enhanced(page_text, soup),
                 'social_media': self._extract_social_media_enhanced(page_text, soup),
                 'years_in_business': self._extract_years_in_business_enhanced(page_text, soup),
@@ -662,7 +1165,81 @@ class AIEnhancedMetalScraper:
         
         return None
 
-    def _extract_phone_enhanced(self, page_text, soup):
+    def _build_keyword_db(self):
+        """Compile every page keyword into one Hyperscan literal database"""
+        if not HAS_HYPERSCAN:
+            return None
+        
+        try:
+            db = hyperscan.Database()
+            db.compile(
+                expressions=[keyword.encode() for _, keyword in self._keyword_ids],
+                ids=list(range(len(self._keyword_ids))),
+                elements=len(self._keyword_ids),
+                flags=hyperscan.HS_FLAG_SINGLEMATCH,
+                literal=True
+            )
+            return db
+        except Exception as e:
+            self.logger.warning(f"Hyperscan keyword database unavailable, using substring checks: {e}")
+            return None
+
+    def _build_keyword_automaton(self):
+        """Build one Aho-Corasick automaton over every page keyword"""
+        if not HAS_AHOCORASICK:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for keyword_id, (_, keyword) in enumerate(self._keyword_ids):
+            automaton.add_word(keyword, keyword_id)
+        automaton.make_automaton()
+        return automaton
+
+    def _find_keywords(self, text_lower):
+        """Keywords of each family found in the lowercased page text, in listed order"""
+        if self._keyword_db is not None:
+            # Scratch space cannot be shared between concurrent scans, so keep one per worker thread
+            scratch = getattr(self._scratch, 'space', None)
+            if scratch is None:
+                scratch = self._scratch.space = hyperscan.Scratch(self._keyword_db)
+            
+            matched = set()
+            self._keyword_db.scan(text_lower.encode('utf-8', 'surrogatepass'),
+                                  match_event_handler=lambda keyword_id, *_: matched.add(keyword_id),
+                                  scratch=scratch)
+        elif self._keyword_automaton is not None:
+            matched = {keyword_id for _, keyword_id in self._keyword_automaton.iter(text_lower)}
+        else:
+            return {family: [keyword for keyword in keywords if keyword in text_lower]
+                    for family, keywords in self._keyword_families.items()}
+        
+        found = {family: [] for family in self._keyword_families}
+        for keyword_id in sorted(matched):
+            family, keyword = self._keyword_ids[keyword_id]
+            found[family].append(keyword)
+        return found
+
+    def _build_microdata_index(self, soup):
+        """Collect every element with an itemprop attribute in one DOM walk"""
+        return soup.find_all(attrs={'itemprop': True})
+
+    def _microdata_elements(self, microdata, pattern_key):
+        """Microdata elements whose itemprop matches the given pattern, in document order"""
+        pattern = self._PATTERNS[pattern_key]
+        return (element for element in microdata if pattern.search(element['itemprop']))
+
+    def _stream_business(self, business):
+        """Append one extracted business to the JSONL stream, if one is open"""
+        if self._sink is None:
+            return
+        
+        if HAS_ORJSON:
+            line = orjson.dumps(business, default=str)
+        else:
+            line = json.dumps(business, default=str, ensure_ascii=False).encode('utf-8')
+        self._sink.write(line + b'\n')
+
+    def _extract_phone_enhanced(self, page_text, soup, microdata):
         """Enhanced phone extraction with AI and phonenumbers library"""
         phone = None
         
@@ -678,7 +1255,7 @@ class AIEnhancedMetalScraper:
             return phone
         
         # Method 3: HTML parsing
-        phone = self._extract_phone_from_html(soup)
+        phone = self._extract_phone_from_html(soup, microdata)
         if phone:
             return phone
         
@@ -688,7 +1265,7 @@ class AIEnhancedMetalScraper:
             return phone
         
         # Method 5: AI-enhanced extraction (if available)
-        if HAS_AI and hasattr(self, 'ner_pipeline') and self.ner_pipeline:
+        if HAS_AI and self.ner_pipeline:
             phone = self._extract_phone_with_ai(page_text)
             if phone:
                 return phone
@@ -697,16 +1274,14 @@ class AIEnhancedMetalScraper:
 
     def _extract_phone_with_phonenumbers(self, text):
         """Extract phone using phonenumbers library"""
+        # The matcher is costly to set up; without a run of digits there is nothing to find
+        if not self._PATTERNS['digit_run'].search(text):
+            return None
+        
         try:
-            import phonenumbers
-            from phonenumbers import geocoder, carrier
-            
-            # Find all potential phone numbers
-            for match in phonenumbers.PhoneNumberMatcher(text, "US"):
-                number = match.number
-                if phonenumbers.is_valid_number(number):
-                    formatted = phonenumbers.format_number(number, phonenumbers.PhoneNumberFormat.NATIONAL)
-                    return formatted
+            # Find all potential phone numbers; VALID leniency already rejects invalid ones
+            for match in phonenumbers.PhoneNumberMatcher(text, "US", leniency=phonenumbers.Leniency.VALID):
+                return phonenumbers.format_number(match.number, phonenumbers.PhoneNumberFormat.NATIONAL)
         except Exception as e:
             self.logger.debug(f"phonenumbers extraction failed: {e}")
         
@@ -714,30 +1289,11 @@ class AIEnhancedMetalScraper:
 
     def _extract_phone_with_regex(self, text):
         """Enhanced regex phone extraction"""
-        # Comprehensive US phone patterns
-        patterns = [
-            # Standard formats
-            r'\b\(?([2-9][0-9]{2})\)?[-.\s]?([2-9][0-9]{2})[-.\s]?([0-9]{4})\b',
-            r'\b1[-.\s]?\(?([2-9][0-9]{2})\)?[-.\s]?([2-9][0-9]{2})[-.\s]?([0-9]{4})\b',
-            
-            # tel: links
-            r'tel:[\s]*\+?1?[-.\s]?\(?([2-9][0-9]{2})\)?[-.\s]?([2-9][0-9]{2})[-.\s]?([0-9]{4})',
-            
-            # With extensions
-            r'\b\(?([2-9][0-9]{2})\)?[-.\s]?([2-9][0-9]{2})[-.\s]?([0-9]{4})(?:\s*(?:ext|x|extension)\.?\s*\d{1,4})?\b',
-            
-            # International format
-            r'\+1[-.\s]?\(?([2-9][0-9]{2})\)?[-.\s]?([2-9][0-9]{2})[-.\s]?([0-9]{4})\b',
-            
-            # Separated by spaces
-            r'\b([2-9][0-9]{2})\s+([2-9][0-9]{2})\s+([0-9]{4})\b',
-            
-            # Dot separated
-            r'\b([2-9][0-9]{2})\.([2-9][0-9]{2})\.([0-9]{4})\b'
-        ]
+        if not self._PATTERNS['digit_run'].search(text):
+            return None
         
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in self._PATTERNS['phone_us']:
+            matches = pattern.findall(text)
             for match in matches:
                 if len(match) == 3:
                     area, exchange, number = match
@@ -746,10 +1302,10 @@ class AIEnhancedMetalScraper:
         
         return None
 
-    def _extract_phone_from_html(self, soup):
+    def _extract_phone_from_html(self, soup, microdata):
         """Extract phone from HTML elements"""
         # tel: links
-        tel_links = soup.find_all('a', href=lambda x: x and x.startswith('tel:'))
+        tel_links = self._SELECTORS['tel_links'].iselect(soup)
         for link in tel_links:
             tel_value = link.get('href', '').replace('tel:', '').strip()
             phone = self._clean_phone_number(tel_value)
@@ -757,7 +1313,7 @@ class AIEnhancedMetalScraper:
                 return phone
         
         # Microdata
-        phone_elements = soup.find_all(attrs={'itemprop': re.compile(r'telephone|phone', re.IGNORECASE)})
+        phone_elements = self._microdata_elements(microdata, 'itemprop_phone')
         for element in phone_elements:
             content = element.get('content') or element.get_text().strip()
             phone = self._clean_phone_number(content)
@@ -765,7 +1321,7 @@ class AIEnhancedMetalScraper:
                 return phone
         
         # Class-based search
-        phone_classes = soup.find_all(class_=re.compile(r'phone|tel|contact', re.IGNORECASE))
+        phone_classes = self._SELECTORS['phone_class'].iselect(soup)
         for element in phone_classes:
             text = element.get_text().strip()
             phone = self._extract_phone_with_regex(text)
@@ -778,7 +1334,7 @@ class AIEnhancedMetalScraper:
         """Extract phone using AI NER"""
         try:
             # Use NER to find phone-like entities
-            entities = self.ner_pipeline(text[:1000])  # Limit text length
+            entities = self._ner_entities(text)
             
             for entity in entities:
                 if 'phone' in entity.get('word', '').lower():
@@ -797,31 +1353,14 @@ class AIEnhancedMetalScraper:
         if len(area_code) != 3 or len(exchange) != 3 or len(number) != 4:
             return False
         
-        # Must be digits
-        if not (area_code.isdigit() and exchange.isdigit() and number.isdigit()):
-            return False
-        
-        # Area code validation
-        if area_code[0] in ['0', '1']:
-            return False
-        
-        # Exchange validation
-        if exchange[0] in ['0', '1']:
-            return False
-        
-        # Block invalid patterns
-        if area_code == '000' or exchange == '000' or number == '0000':
-            return False
-        
-        # Block test numbers
-        if area_code == '555' and exchange == '555':
-            return False
-        
-        # Block emergency numbers
-        if area_code + exchange + number in ['9111111111']:
+        try:
+            area, prefix, line = int(area_code), int(exchange), int(number)
+        except ValueError:
             return False
         
-        return True
+        # Area code and exchange start with 2-9, the line is not 0000,
+        # and 555-555 numbers are test numbers
+        return area >= 200 and prefix >= 200 and line != 0 and not (area == 555 and prefix == 555)
 
     def _clean_phone_number(self, phone_str):
         """Clean and format phone number"""
@@ -829,7 +1368,7 @@ class AIEnhancedMetalScraper:
             return None
         
         # Extract digits
-        digits = re.sub(r'\D', '', str(phone_str))
+        digits = str(phone_str).translate(_KEEP_DIGITS)
         
         # Handle different lengths
         if len(digits) == 10:
@@ -848,10 +1387,10 @@ class AIEnhancedMetalScraper:
         
         return None
 
-    def _extract_email_enhanced(self, page_text, soup):
+    def _extract_email_enhanced(self, page_text, soup, microdata):
         """Enhanced email extraction"""
         # Method 1: mailto links
-        mailto_links = soup.find_all('a', href=lambda x: x and x.startswith('mailto:'))
+        mailto_links = self._SELECTORS['mailto_links'].iselect(soup)
         for link in mailto_links:
             email = link.get('href', '').replace('mailto:', '').strip()
             if self._validate_email_enhanced(email):
@@ -863,7 +1402,7 @@ class AIEnhancedMetalScraper:
             return email
         
         # Method 3: HTML microdata
-        email_elements = soup.find_all(attrs={'itemprop': re.compile(r'email', re.IGNORECASE)})
+        email_elements = self._microdata_elements(microdata, 'itemprop_email')
         for element in email_elements:
             content = element.get('content') or element.get_text().strip()
             if self._validate_email_enhanced(content):
@@ -875,7 +1414,7 @@ class AIEnhancedMetalScraper:
             return email
         
         # Method 5: AI-enhanced extraction (if available)
-        if HAS_AI and hasattr(self, 'ner_pipeline') and self.ner_pipeline:
+        if HAS_AI and self.ner_pipeline:
             email = self._extract_email_with_ai(page_text, soup)
             if email:
                 return email
@@ -884,24 +1423,16 @@ class AIEnhancedMetalScraper:
 
     def _extract_email_with_regex(self, text):
         """Extract email using enhanced regex"""
-        patterns = [
-            # Standard email
-            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-            # With spaces around @
-            r'\b[A-Za-z0-9._%+-]+\s*@\s*[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-            # With [at] replacement
-            r'\b[A-Za-z0-9._%+-]+\s*\[at\]\s*[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-            # With (at) replacement
-            r'\b[A-Za-z0-9._%+-]+\s*\(at\)\s*[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-            # With AT replacement
-            r'\b[A-Za-z0-9._%+-]+\s*AT\s*[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        ]
+        # One scan finds the first candidate; no pattern can match before it
+        candidate = self._PATTERNS['email_any'].search(text)
+        if not candidate:
+            return None
         
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in self._PATTERNS['email']:
+            matches = pattern.findall(text, candidate.start())
             for match in matches:
                 # Clean the email
-                email = re.sub(r'\s+', '', match)
+                email = self._PATTERNS['whitespace'].sub('', match)
                 email = email.replace('[at]', '@').replace('(at)', '@').replace('AT', '@')
                 
                 if self._validate_email_enhanced(email):
@@ -914,7 +1445,7 @@ class AIEnhancedMetalScraper:
         try:
             if self.ner_pipeline:
                 # Use NER to find email-like entities
-                entities = self.ner_pipeline(page_text[:1000])
+                entities = self._ner_entities(page_text)
                 
                 for entity in entities:
                     word = entity.get('word', '')
@@ -932,18 +1463,12 @@ class AIEnhancedMetalScraper:
             return False
         
         # Basic format check
-        email_pattern = r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}$'
-        if not re.match(email_pattern, email):
+        if not self._PATTERNS['email_validate'].match(email):
             return False
         
         # Exclude test domains
-        test_domains = [
-            'example.com', 'test.com', 'sample.com', 'demo.com',
-            'placeholder.com', 'dummy.com', 'fake.com'
-        ]
-        
         domain = email.split('@')[1].lower()
-        if domain in test_domains:
+        if domain in self.TEST_EMAIL_DOMAINS:
             return False
         
         return True
@@ -982,23 +1507,18 @@ class AIEnhancedMetalScraper:
         # Fallback to search result title
         return link_data.get('title', 'Unknown Business')[:150]
 
-    def _extract_address_enhanced(self, page_text, soup):
+    def _extract_address_enhanced(self, page_text, soup, microdata):
         """Enhanced address extraction"""
         # Method 1: Microdata
-        address_elements = soup.find_all(attrs={'itemprop': re.compile(r'address|street', re.IGNORECASE)})
+        address_elements = self._microdata_elements(microdata, 'itemprop_address')
         for element in address_elements:
             address = element.get('content') or element.get_text().strip()
             if address and len(address) > 10:
                 return address[:200]
         
         # Method 2: Regex patterns
-        address_patterns = [
-            r'\b\d+\s+[A-Za-z0-9\s]+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Boulevard|Blvd|Lane|Ln|Way|Circle|Cir|Court|Ct)\b[^,\n]*',
-            r'\b\d+\s+[A-Za-z0-9\s]+(?:St|Ave|Rd|Dr|Blvd|Ln|Way|Cir|Ct)\.?\s*[,\n]?[^,\n]*'
-        ]
-        
-        for pattern in address_patterns:
-            matches = re.findall(pattern, page_text, re.IGNORECASE)
+        for pattern in self._PATTERNS['address']:
+            matches = pattern.findall(page_text)
             if matches:
                 return matches[0][:200]
         
@@ -1012,7 +1532,7 @@ class AIEnhancedMetalScraper:
         """Extract address using AI NER"""
         try:
             if self.ner_pipeline:
-                entities = self.ner_pipeline(text[:1000])
+                entities = self._ner_entities(text)
                 
                 addresses = []
                 for entity in entities:
@@ -1026,68 +1546,49 @@ class AIEnhancedMetalScraper:
         
         return None
 
-    def _extract_city_enhanced(self, page_text, soup):
+    def _extract_city_enhanced(self, page_text, soup, microdata):
         """Enhanced city extraction"""
         # Microdata
-        city_elements = soup.find_all(attrs={'itemprop': re.compile(r'city|locality', re.IGNORECASE)})
+        city_elements = self._microdata_elements(microdata, 'itemprop_city')
         for element in city_elements:
             city = element.get('content') or element.get_text().strip()
             if city and len(city) > 2:
                 return city[:50]
         
         # Regex patterns
-        city_patterns = [
-            r'\b([A-Za-z\s]+),\s*([A-Z]{2})\s*\d{5}',
-            r'(?:City|Town|Village):\s*([A-Za-z\s]+)',
-            r'Located in ([A-Za-z\s]+),\s*[A-Z]{2}'
-        ]
-        
-        for pattern in city_patterns:
-            matches = re.findall(pattern, page_text, re.IGNORECASE)
+        for pattern in self._PATTERNS['city']:
+            matches = pattern.findall(page_text)
             if matches:
                 city = matches[0] if isinstance(matches[0], str) else matches[0][0]
                 return city.strip()[:50]
         
         return None
 
-    def _extract_state_enhanced(self, page_text, soup):
+    def _extract_state_enhanced(self, page_text, soup, microdata):
         """Enhanced state extraction"""
         # Microdata
-        state_elements = soup.find_all(attrs={'itemprop': re.compile(r'state|region', re.IGNORECASE)})
+        state_elements = self._microdata_elements(microdata, 'itemprop_state')
         for element in state_elements:
             state = element.get('content') or element.get_text().strip()
             if state and len(state) >= 2:
                 return state[:20]
         
         # Regex for state codes
-        state_pattern = r'\b([A-Z]{2})\s*\d{5}(?:-\d{4})?\b'
-        matches = re.findall(state_pattern, page_text)
-        
-        us_states = ['AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA', 'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD', 'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ', 'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC', 'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY']
-        
-        for match in matches:
-            if match in us_states:
-                return match
-        
-        return None
+        match = self._PATTERNS['state_zip'].search(page_text)
+        return match.group(1) if match else None
 
-    def _extract_zip_enhanced(self, page_text, soup):
+    def _extract_zip_enhanced(self, page_text, soup, microdata):
         """Enhanced ZIP code extraction"""
         # Microdata
-        zip_elements = soup.find_all(attrs={'itemprop': re.compile(r'postal|zip', re.IGNORECASE)})
+        zip_elements = self._microdata_elements(microdata, 'itemprop_zip')
         for element in zip_elements:
             zip_code = element.get('content') or element.get_text().strip()
-            if zip_code and re.match(r'^\d{5}(-\d{4})?$', zip_code):
+            if zip_code and self._PATTERNS['zip_exact'].match(zip_code):
                 return zip_code
         
         # Regex patterns
-        zip_patterns = [
-            r'\b(\d{5}(?:-\d{4})?)\b',  # US ZIP
-            r'\b([A-Z]\d[A-Z]\s*\d[A-Z]\d)\b'  # Canadian postal code
-        ]
-        
-        for pattern in zip_patterns:
-            matches = re.findall(pattern, page_text)
+        for pattern in self._PATTERNS['zip']:
+            matches = pattern.findall(page_text)
             if matches:
                 return matches[0]
         
@@ -1110,9 +1611,8 @@ class AIEnhancedMetalScraper:
                 return content[:500]
         
         # About section
-        about_selectors = ['.about', '.description', '.overview', '.intro', '.summary']
-        for selector in about_selectors:
-            elements = soup.select(selector)
+        for selector in self._SELECTORS['about']:
+            elements = selector.iselect(soup)
             for element in elements:
                 text = element.get_text(strip=True)
                 if len(text) > 50:
@@ -1120,15 +1620,9 @@ class AIEnhancedMetalScraper:
         
         return None
 
-    def _extract_materials_enhanced(self, page_text, soup):
+    def _extract_materials_enhanced(self, page_text, soup, keywords):
         """Enhanced materials extraction"""
-        materials_found = []
-        text_lower = page_text.lower()
-        
-        # Check for each material keyword
-        for material in self.material_keywords:
-            if material in text_lower:
-                materials_found.append(material)
+        materials_found = list(keywords['materials'])
         
         # Use AI to extract additional materials
         if HAS_AI and materials_found:
@@ -1142,7 +1636,7 @@ class AIEnhancedMetalScraper:
         """Extract materials using AI NER"""
         try:
             if self.ner_pipeline:
-                entities = self.ner_pipeline(text[:1000])
+                entities = self._ner_entities(text)
                 
                 materials = []
                 for entity in entities:
@@ -1156,37 +1650,23 @@ class AIEnhancedMetalScraper:
         
         return []
 
-    def _extract_services_enhanced(self, page_text, soup):
+    def _extract_services_enhanced(self, page_text, soup, keywords):
         """Enhanced services extraction"""
-        services_keywords = [
-            'pickup', 'collection', 'container rental', 'roll-off', 'demolition',
-            'dismantling', 'processing', 'sorting', 'weighing', 'cash payment',
-            'commercial', 'residential', 'industrial', 'certified scales',
-            'licensed', 'insured', 'bonded', 'environmental compliance'
-        ]
-        
-        services_found = []
-        text_lower = page_text.lower()
-        
-        for service in services_keywords:
-            if service in text_lower:
-                services_found.append(service)
-        
+        services_found = keywords['services']
         return services_found if services_found else None
 
-    def _extract_hours_enhanced(self, page_text, soup):
+    def _extract_hours_enhanced(self, page_text, soup, microdata):
         """Enhanced working hours extraction"""
         # Look for microdata
-        hours_elements = soup.find_all(attrs={'itemprop': re.compile(r'openingHours|hours', re.IGNORECASE)})
+        hours_elements = self._microdata_elements(microdata, 'itemprop_hours')
         for element in hours_elements:
             hours = element.get('content') or element.get_text().strip()
             if hours and len(hours) > 10:
                 return hours[:200]
         
         # Look for class-based selectors
-        hours_selectors = ['.hours', '.opening-hours', '.business-hours', '.working-hours']
-        for selector in hours_selectors:
-            elements = soup.select(selector)
+        for selector in self._SELECTORS['hours']:
+            elements = selector.iselect(soup)
             for element in elements:
                 hours_text = element.get_text(strip=True)
                 if len(hours_text) > 10:
@@ -1194,73 +1674,34 @@ class AIEnhancedMetalScraper:
         
         return None
 
-    def _extract_payment_methods_enhanced(self, page_text, soup):
+    def _extract_payment_methods_enhanced(self, page_text, soup, keywords):
         """Enhanced payment methods extraction"""
-        payment_keywords = [
-            'cash', 'check', 'credit card', 'debit card', 'visa', 'mastercard',
-            'american express', 'discover', 'paypal', 'wire transfer',
-            'bank transfer', 'financing', 'net terms'
-        ]
-        
-        payment_methods = []
-        text_lower = page_text.lower()
-        
-        for method in payment_keywords:
-            if method in text_lower:
-                payment_methods.append(method)
-        
+        payment_methods = keywords['payment']
         return payment_methods if payment_methods else None
 
     def _extract_certifications_enhanced(self, page_text, soup):
         """Enhanced certifications extraction"""
-        cert_patterns = [
-            r'ISO\s*\d{4,5}',
-            r'R2\s*certified',
-            r'EPA\s*registered',
-            r'ISRI\s*member',
-            r'certified\s+\w+',
-            r'licensed\s+\w+',
-            r'OSHA\s*compliant'
-        ]
-        
         certifications = []
-        for pattern in cert_patterns:
-            matches = re.findall(pattern, page_text, re.IGNORECASE)
+        for pattern in self._PATTERNS['certifications']:
+            matches = pattern.findall(page_text)
             certifications.extend(matches)
         
         return certifications[:5] if certifications else None
 
     def _extract_social_media_enhanced(self, page_text, soup):
         """Enhanced social media extraction"""
-        social_patterns = {
-            'facebook': r'(?:facebook\.com|fb\.com)/([^/\s]+)',
-            'twitter': r'(?:twitter\.com|x\.com)/([^/\s]+)',
-            'instagram': r'instagram\.com/([^/\s]+)',
-            'linkedin': r'linkedin\.com/company/([^/\s]+)',
-            'youtube': r'youtube\.com/(?:channel|user)/([^/\s]+)',
-            'tiktok': r'tiktok\.com/@([^/\s]+)'
-        }
-        
         social_media = {}
-        for platform, pattern in social_patterns.items():
-            matches = re.findall(pattern, page_text, re.IGNORECASE)
+        for network, pattern in self._PATTERNS['social'].items():
+            matches = pattern.findall(page_text)
             if matches:
-                social_media[platform] = matches[0]
+                social_media[network] = matches[0]
         
         return social_media if social_media else None
 
     def _extract_years_in_business_enhanced(self, page_text, soup):
         """Enhanced years in business extraction"""
-        years_patterns = [
-            r'(\d{1,2})\s*\+?\s*years?\s+(?:in\s+)?business',
-            r'established\s+(?:in\s+)?(\d{4})',
-            r'since\s+(\d{4})',
-            r'founded\s+(?:in\s+)?(\d{4})',
-            r'serving\s+(?:for\s+)?(\d{1,2})\s*years?'
-        ]
-        
-        for pattern in years_patterns:
-            matches = re.findall(pattern, page_text, re.IGNORECASE)
+        for pattern in self._PATTERNS['years']:
+            matches = pattern.findall(page_text)
             if matches:
                 return matches[0]
         
@@ -1268,32 +1709,18 @@ class AIEnhancedMetalScraper:
 
     def _extract_languages_enhanced(self, page_text, soup):
         """Enhanced languages extraction"""
-        language_patterns = [
-            r'languages?\s*:?\s*([^.]+)',
-            r'(?:we\s+)?speak\s+([^.]+)',
-            r'bilingual\s+([^.]+)',
-            r'(?:english|spanish|french|german|italian|chinese|korean|japanese|arabic|russian)',
-        ]
-        
         languages = []
-        for pattern in language_patterns:
-            matches = re.findall(pattern, page_text, re.IGNORECASE)
+        for pattern in self._PATTERNS['languages']:
+            matches = pattern.findall(page_text)
             languages.extend(matches)
         
         return languages[:3] if languages else None
 
     def _extract_additional_info_enhanced(self, page_text, soup):
         """Enhanced additional info extraction"""
-        info_patterns = [
-            r'(?:we\s+also|additionally|other\s+services)\s*:?\s*([^.]+)',
-            r'specializing\s+in\s+([^.]+)',
-            r'expertise\s+in\s+([^.]+)',
-            r'focus\s+on\s+([^.]+)'
-        ]
-        
         additional_info = []
-        for pattern in info_patterns:
-            matches = re.findall(pattern, page_text, re.IGNORECASE)
+        for pattern in self._PATTERNS['additional_info']:
+            matches = pattern.findall(page_text)
             additional_info.extend(matches)
         
         return additional_info[:3] if additional_info else None
@@ -1301,8 +1728,8 @@ class AIEnhancedMetalScraper:
     def _enhance_data_with_ai(self, business_data, page_text, soup):
         """Enhance business data using AI"""
         try:
-            # Use AI to improve business name
-            if HAS_AI and self.nlp:
+            # Use AI to improve business name; spaCy only fills a missing name or city
+            if HAS_AI and self.nlp and not (business_data.get('name') and business_data.get('city')):
                 doc = self.nlp(page_text[:1000])
                 
                 # Extract organization entities
@@ -1339,38 +1766,29 @@ class AIEnhancedMetalScraper:
 
     def _validate_with_ai(self, businesses):
         """Validate business data using AI"""
-        if not HAS_AI:
+        if not HAS_AI or not self.sentence_model or not businesses:
             return businesses
         
-        validated = []
-        
-        for business in businesses:
-            try:
-                # AI-based relevance scoring
-                if self.sentence_model:
-                    business_text = f"{business.get('name', '')} {business.get('description', '')} {business.get('materials_accepted', '')}"
-                    target_text = "scrap metal recycling business"
-                    
-                    business_embedding = self.sentence_model.encode([business_text])
-                    target_embedding = self.sentence_model.encode([target_text])
-                    
-                    similarity = torch.cosine_similarity(
-                        torch.tensor(business_embedding),
-                        torch.tensor(target_embedding)
-                    )[0].item()
-                    
-                    business['ai_relevance_score'] = similarity
-                    
-                    if similarity > 0.2:  # Threshold for relevance
-                        validated.append(business)
-                else:
+        try:
+            # AI-based relevance scoring, one batched encode for the whole list
+            texts = [
+                f"{business.get('name', '')} {business.get('description', '')} {business.get('materials_accepted', '')}"
+                for business in businesses
+            ]
+            similarities = self._embed_texts(texts) @ self._business_target_emb
+            
+            validated = []
+            for business, similarity in zip(businesses, similarities.tolist()):
+                business['ai_relevance_score'] = similarity
+                
+                if similarity > 0.2:  # Threshold for relevance
                     validated.append(business)
-                    
-            except Exception as e:
-                self.logger.debug(f"AI validation failed: {e}")
-                validated.append(business)
-        
-        return validated
+            
+            return validated
+            
+        except Exception as e:
+            self.logger.debug(f"AI validation failed: {e}")
+            return businesses
 
     def _meets_minimum_requirements(self, business_data):
         """Check if business meets minimum data requirements"""
@@ -1385,25 +1803,15 @@ class AIEnhancedMetalScraper:
         else:
             # Fallback: basic keyword relevance check
             text_to_check = f"{business_data.get('name', '')} {business_data.get('description', '')} {business_data.get('website', '')}"
-            basic_keywords = ['scrap', 'metal', 'recycling', 'salvage', 'steel', 'aluminum', 'copper', 'iron', 'brass']
-            has_relevance = any(keyword in text_to_check.lower() for keyword in basic_keywords)
+            has_relevance = bool(self._basic_relevance_re.search(text_to_check.lower()))
         
         return has_name and has_contact and has_relevance
 
     def _calculate_data_completeness(self, business_data):
         """Calculate data completeness percentage"""
-        important_fields = [
-            'name', 'phone', 'email', 'website', 'address', 'city', 'state',
-            'description', 'materials_accepted', 'services', 'working_hours'
-        ]
-        
-        filled_fields = 0
-        for field in important_fields:
-            value = business_data.get(field)
-            if value and (not isinstance(value, list) or len(value) > 0):
-                filled_fields += 1
-        
-        return int((filled_fields / len(important_fields)) * 100)
+        # Empty strings and empty lists are falsy, so truthiness covers both
+        filled_fields = sum(1 for field in self.COMPLETENESS_FIELDS if business_data.get(field))
+        return filled_fields * 100 // len(self.COMPLETENESS_FIELDS)
 
     def _finalize_results(self, businesses, target_count):
         """Finalize and optimize results"""
@@ -1425,13 +1833,12 @@ class AIEnhancedMetalScraper:
         unique_businesses = []
         
         for business in businesses:
-            phone = business.get('phone', '')
-            email = business.get('email', '')
-            name = business.get('name', '').lower()
-            
-            # Create unique identifiers
-            contact_key = f"{phone}|{email}"
-            name_key = name[:50]  # First 50 chars of name
+            # Canonical identifiers: phone digits only, so formatting variants collapse
+            contact_key = (
+                (business.get('phone') or '').translate(_KEEP_DIGITS),
+                (business.get('email') or '').lower()
+            )
+            name_key = (business.get('name') or '').lower()[:50]  # First 50 chars of name
             
             if contact_key not in seen_contacts and name_key not in seen_names:
                 seen_contacts.add(contact_key)
@@ -1442,46 +1849,31 @@ class AIEnhancedMetalScraper:
 
     def _extract_phone_simple(self, text):
         """Simple phone extraction that should work reliably"""
-        if not text:
+        if not text or not self._PATTERNS['digit_run'].search(text):
             return None
         
-        # Simple US phone patterns
-        patterns = [
-            r'\((\d{3})\)[\s\-]?(\d{3})[\s\-]?(\d{4})',  # (123) 456-7890
-            r'(\d{3})[\s\-\.](\d{3})[\s\-\.](\d{4})',     # 123-456-7890 or 123.456.7890
-            r'(\d{3})\s(\d{3})\s(\d{4})',                 # 123 456 7890
-            r'1[\s\-]?(\d{3})[\s\-]?(\d{3})[\s\-]?(\d{4})', # 1-123-456-7890
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                match = matches[0]
-                if len(match) == 3:
-                    area, exchange, number = match
-                    # Simple validation - exclude obviously invalid
-                    if area != '000' and exchange != '000' and number != '0000':
-                        return f"({area}) {exchange}-{number}"
-                elif len(match) == 4:  # For pattern with country code
-                    area, exchange, number = match[1], match[2], match[3]
-                    if area != '000' and exchange != '000' and number != '0000':
-                        return f"({area}) {exchange}-{number}"
+        for pattern in self._PATTERNS['phone_simple']:
+            # Only the first match of each pattern is considered
+            match = pattern.search(text)
+            if match:
+                area, exchange, number = match.groups()
+                # Simple validation - exclude obviously invalid
+                if (area not in self.SIMPLE_PHONE_BAD_AREAS and exchange not in self.SIMPLE_PHONE_BAD_EXCHANGES
+                        and number not in self.SIMPLE_PHONE_BAD_NUMBERS):
+                    return f"({area}) {exchange}-{number}"
         
         return None
     
     def _extract_email_simple(self, text):
         """Simple email extraction that should work reliably"""
-        if not text:
+        if not text or '@' not in text:
             return None
         
-        # Simple email pattern
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        
-        matches = re.findall(email_pattern, text)
+        matches = self._PATTERNS['email_simple'].findall(text)
         for email in matches:
             email = email.lower()
             # Exclude obvious test domains
-            if not any(bad in email for bad in ['example.com', 'test.com', 'sample.com', 'placeholder.com']):
+            if not self._PATTERNS['email_simple_test_domain'].search(email):
                 return email
         
         return None
@@ -1495,18 +1887,19 @@ class AIEnhancedMetalScraper:
                            if business.get('phone') or business.get('email'))
         return (with_contacts / len(self.results)) * 100
 
-    def _deduplicate_links(self, links):
-        """Remove duplicate links"""
-        seen_urls = set()
-        unique_links = []
-        
-        for link in links:
-            url = link['url']
-            if url not in seen_urls:
-                seen_urls.add(url)
-                unique_links.append(link)
-        
-        return unique_links
+    @staticmethod
+    def _filled_mask(df, column):
+        """Rows whose value in column is truthy, matching business.get(column)"""
+        if column not in df:
+            return pd.Series(False, index=df.index)
+        return df[column].fillna('').astype(bool)
+
+    @staticmethod
+    def _column_mean(df, column):
+        """Mean of a numeric column, counting missing values as 0"""
+        if column not in df:
+            return 0.0
+        return float(df[column].fillna(0).mean())
 
     def export_results(self, output_dir="output"):
         """Export results with enhanced formatting"""
@@ -1517,59 +1910,107 @@ class AIEnhancedMetalScraper:
         os.makedirs(output_dir, exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # Create DataFrame
+        # Create DataFrame; small-vocabulary text columns become int-coded categoricals
         df = pd.DataFrame(self.results)
+        for column in self.CATEGORICAL_COLUMNS:
+            if column in df:
+                df[column] = df[column].astype('category')
+        
+        # Config.OUTPUT_FORMAT may name one format; any other value ('all', 'both', ...) writes them all
+        output_format = Config.OUTPUT_FORMAT.lower()
+        formats = {output_format} if output_format in self.EXPORT_FORMATS else set(self.EXPORT_FORMATS)
+        files = {}
         
         # CSV export
-        csv_file = os.path.join(output_dir, f"ai_enhanced_metal_businesses_{timestamp}.csv")
-        df.to_csv(csv_file, index=False)
+        if 'csv' in formats:
+            csv_file = os.path.join(output_dir, f"ai_enhanced_metal_businesses_{timestamp}.csv")
+            self._write_csv(df, csv_file)
+            files['csv'] = csv_file
         
         # Excel export with multiple sheets
-        excel_file = os.path.join(output_dir, f"ai_enhanced_metal_businesses_{timestamp}.xlsx")
-        with pd.ExcelWriter(excel_file, engine='openpyxl') as writer:
-            # Main sheet
-            df.to_excel(writer, sheet_name='All Businesses', index=False)
-            
-            # High-quality data sheet
-            high_quality = df[df['data_completeness'] >= 70]
-            if not high_quality.empty:
-                high_quality.to_excel(writer, sheet_name='High Quality Data', index=False)
-            
-            # Contact sheet
-            contact_columns = ['name', 'phone', 'email', 'website', 'address', 'city', 'state']
-            available_columns = [col for col in contact_columns if col in df.columns]
-            if available_columns:
-                df[available_columns].to_excel(writer, sheet_name='Contact Information', index=False)
-            
-            # AI insights sheet
-            ai_columns = ['name', 'ai_relevance_score', 'data_completeness', 'materials_accepted']
-            available_ai_columns = [col for col in ai_columns if col in df.columns]
-            if available_ai_columns:
-                df[available_ai_columns].to_excel(writer, sheet_name='AI Insights', index=False)
+        if 'excel' in formats:
+            excel_file = os.path.join(output_dir, f"ai_enhanced_metal_businesses_{timestamp}.xlsx")
+            # pandas writes cells column by column, so XlsxWriter's constant_memory mode cannot be used
+            with pd.ExcelWriter(excel_file, engine='xlsxwriter' if HAS_XLSXWRITER else 'openpyxl') as writer:
+                # Main sheet
+                df.to_excel(writer, sheet_name='All Businesses', index=False)
+                
+                # High-quality data sheet; the mask is checked before any rows are copied
+                high_quality_mask = df['data_completeness'].to_numpy() >= 70
+                if high_quality_mask.any():
+                    df[high_quality_mask].to_excel(writer, sheet_name='High Quality Data', index=False)
+                
+                # Contact sheet
+                available_columns = [col for col in self.CONTACT_SHEET_COLUMNS if col in df.columns]
+                if available_columns:
+                    df[available_columns].to_excel(writer, sheet_name='Contact Information', index=False)
+                
+                # AI insights sheet
+                available_ai_columns = [col for col in self.AI_SHEET_COLUMNS if col in df.columns]
+                if available_ai_columns:
+                    df[available_ai_columns].to_excel(writer, sheet_name='AI Insights', index=False)
+            files['excel'] = excel_file
         
         # JSON export
-        json_file = os.path.join(output_dir, f"ai_enhanced_metal_businesses_{timestamp}.json")
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(self.results, f, indent=2, default=str, ensure_ascii=False)
+        if 'json' in formats:
+            json_file = os.path.join(output_dir, f"ai_enhanced_metal_businesses_{timestamp}.json")
+            # Compact output unless Config.JSON_PRETTY_PRINT asks for indentation
+            if HAS_ORJSON:
+                options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                if Config.JSON_PRETTY_PRINT:
+                    options |= orjson.OPT_INDENT_2
+                with open(json_file, 'wb') as f:
+                    f.write(orjson.dumps(self.results, default=str, option=options))
+            else:
+                layout = {'indent': 2} if Config.JSON_PRETTY_PRINT else {'separators': (',', ':')}
+                with open(json_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.results, f, default=str, ensure_ascii=False, **layout)
+            files['json'] = json_file
+        
+        # Parquet export: columnar and compressed, much faster to load back than CSV or JSON
+        if 'parquet' in formats and HAS_PYARROW:
+            parquet_file = os.path.join(output_dir, f"ai_enhanced_metal_businesses_{timestamp}.parquet")
+            try:
+                df.to_parquet(parquet_file, engine='pyarrow', compression='zstd', index=False)
+                files['parquet'] = parquet_file
+            except Exception as e:
+                self.logger.warning(f"Parquet export failed: {e}")
         
         # Generate report
-        report_file = self._generate_report(output_dir, timestamp)
+        report_file = self._generate_report(df, output_dir, timestamp)
         
-        self.logger.info(f"✅ AI-Enhanced data exported:")
-        self.logger.info(f"  • CSV: {csv_file}")
-        self.logger.info(f"  • Excel: {excel_file}")
-        self.logger.info(f"  • JSON: {json_file}")
-        self.logger.info(f"  • Report: {report_file}")
+        summary = [f"  • {self.EXPORT_FORMATS[file_format]}: {path}" for file_format, path in files.items()]
+        summary.append(f"  • Report: {report_file}")
+        self.logger.info("✅ AI-Enhanced data exported:\n" + "\n".join(summary))
         
         return {
-            'csv': csv_file,
-            'excel': excel_file,
-            'json': json_file,
+            **files,
             'report': report_file,
             'count': len(self.results)
         }
 
-    def _generate_report(self, output_dir, timestamp):
+    def _write_csv(self, df, csv_file):
+        """Write the CSV export with pyarrow's C++ writer when available, otherwise with pandas"""
+        if HAS_PYARROW:
+            try:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                
+                # Arrow cannot write list or struct columns; render them as pandas' CSV writer does
+                for index, field in enumerate(table.schema):
+                    if pa.types.is_nested(field.type):
+                        values = [str(value) if isinstance(value, (list, tuple, dict)) else None
+                                  for value in df[field.name]]
+                        table = table.set_column(index, field.name, pa.array(values, type=pa.string()))
+                
+                pa_csv.write_csv(table, csv_file)
+                return
+            except Exception as e:
+                # Columns mixing value types cannot be converted to Arrow
+                self.logger.debug(f"pyarrow CSV export failed, using pandas: {e}")
+        
+        df.to_csv(csv_file, index=False, chunksize=Config.CSV_CHUNK_SIZE, lineterminator='\n')
+
+    def _generate_report(self, df, output_dir, timestamp):
         """Generate comprehensive report"""
         report_file = os.path.join(output_dir, f"ai_enhanced_report_{timestamp}.txt")
         
@@ -1577,24 +2018,22 @@ class AIEnhancedMetalScraper:
             f.write("🤖 AI-ENHANCED METAL SCRAPER REPORT\n")
             f.write("=" * 60 + "\n\n")
             f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"AI Models: {'✅ Active' if HAS_AI else '❌ Basic Mode'}\n")
-            f.write(f"Phone Library: {'✅ phonenumbers' if HAS_PHONENUMBERS else '❌ regex only'}\n")
-            f.write(f"Local LLM: {'✅ Ollama' if HAS_OLLAMA else '❌ Not available'}\n\n")
+            f.write(FEATURE_STATUS + "\n\n")
             
-            # Statistics
-            total = len(self.results)
-            with_phone = sum(1 for b in self.results if b.get('phone'))
-            with_email = sum(1 for b in self.results if b.get('email'))
+            # Statistics, computed column-wise on the export DataFrame
+            total = len(df)
+            with_phone = int(self._filled_mask(df, 'phone').sum())
+            with_email = int(self._filled_mask(df, 'email').sum())
             
             f.write("📊 EXTRACTION STATISTICS\n")
             f.write("-" * 30 + "\n")
             f.write(f"Total Businesses: {total}\n")
             f.write(f"With Phone: {with_phone} ({with_phone/total*100:.1f}%)\n")
             f.write(f"With Email: {with_email} ({with_email/total*100:.1f}%)\n")
-            f.write(f"Average Completeness: {sum(b.get('data_completeness', 0) for b in self.results)/total:.1f}%\n")
+            f.write(f"Average Completeness: {self._column_mean(df, 'data_completeness'):.1f}%\n")
             
             if HAS_AI:
-                avg_relevance = sum(b.get('ai_relevance_score', 0) for b in self.results) / total
+                avg_relevance = self._column_mean(df, 'ai_relevance_score')
                 f.write(f"Average AI Relevance: {avg_relevance:.3f}\n")
             
             f.write("\n🎯 DATA QUALITY INSIGHTS\n")
@@ -36,7 +36,7 @@ class Config:
     OUTPUT_DIR.mkdir(exist_ok=True)
     
     # Enhanced target countries for maximum coverage
-    TARGET_COUNTRIES = [
+    TARGET_COUNTRIES = (
         'United States', 'USA', 'US',
         'Canada', 'CA', 'CAN',
         'United Kingdom', 'UK', 'GB', 'England', 'Scotland', 'Wales',
@@ -44,10 +44,10 @@ class Config:
         'New Zealand', 'NZ', 'NZL',
         'Ireland', 'IE', 'IRL',
         'South Africa', 'ZA', 'RSA'
-    ]
+    )
     
     # Comprehensive search terms for maximum data collection
-    SEARCH_TERMS = [
+    SEARCH_TERMS = (
         # Primary terms
         'scrap metal recycling centers',
         'metal recycling facilities',
@@ -101,10 +101,10 @@ class Config:
         'metal recycling depot',
         'metal collection centers',
         'metal disposal services'
-    ]
+    )
     
     # Comprehensive major cities and regions for maximum coverage
-    DEFAULT_LOCATIONS = [
+    DEFAULT_LOCATIONS = (
         # United States - Major cities and regions
         'New York, NY', 'Los Angeles, CA', 'Chicago, IL', 'Houston, TX',
         'Phoenix, AZ', 'Philadelphia, PA', 'San Antonio, TX', 'San Diego, CA',
@@ -178,10 +178,10 @@ class Config:
         'Johannesburg', 'Cape Town', 'Durban', 'Pretoria', 'Port Elizabeth',
         'Bloemfontein', 'East London', 'Pietermaritzburg', 'Kimberley',
         'Polokwane', 'Nelspruit', 'George', 'Rustenburg', 'Witbank'
-    ]
+    )
     
     # Comprehensive material types for enhanced detection
-    MATERIAL_TYPES = [
+    MATERIAL_TYPES = (
         # Base metals
         'copper', 'aluminum', 'steel', 'iron', 'brass', 'bronze',
         'lead', 'zinc', 'nickel', 'tin', 'titanium', 'magnesium',
@@ -212,7 +212,7 @@ class Config:
         # Electronic components
         'circuit boards', 'computer towers', 'servers',
         'cell phones', 'tablets', 'printers', 'monitors'
-    ]
+    )
     
     # Enhanced data fields to collect (15+ comprehensive fields)
     DATA_FIELDS = {
@@ -281,45 +281,3 @@ class Config:
 
     # User agents rotation
     USE_ROTATING_USER_AGENTS = os.getenv('USE_ROTATING_USER_AGENTS', 'True').lower() == 'true'
-    
-    # Google Maps API (optional, for geocoding)
-    ENABLE_GEOCODING = True
-    
-    # Output configuration
-    OUTPUT_FORMAT = os.getenv('OUTPUT_FORMAT', 'both')  # csv, excel, database, both
-    OUTPUT_DIR = os.getenv('OUTPUT_DIR', 'output')
-    
-    # Countries to scrape (ISO country codes)
-    TARGET_COUNTRIES = [
-        'US',  # United States
-        'CA',  # Canada
-        'GB',  # United Kingdom
-        'AU',  # Australia
-        'NZ',  # New Zealand
-        'IE',  # Ireland
-        'ZA',  # South Africa
-    ]
-    
-    # Search terms in different languages
-    SEARCH_TERMS = [
-        'scrap metal recycling centers',
-        'metal recycling facilities',
-        'scrap yards',
-        'scrap metal dealers',
-        'metal waste recycling',
-        'scrap metal buyers',
-        'metal recycling companies',
-        'junk yards metal',
-        'auto recycling centers',
-        'copper recycling centers',
-        'aluminum recycling',
-        'steel recycling facilities'
-    ]
-    
-    # Material types to look for
-    MATERIAL_TYPES = [
-        'copper', 'aluminum', 'steel', 'iron', 'brass', 'bronze',
-        'stainless steel', 'lead', 'zinc', 'nickel', 'tin',
-        'automotive parts', 'appliances', 'electronics', 'wire',
-        'cable', 'radiators', 'catalytic converters', 'batteries'
-    ] 
\ No newline at end of file
@@ -2,13 +2,28 @@ import os
 import json
 import pandas as pd
 import csv
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import chain
 from config import Config
 from models import DatabaseManager
 
+# Optional: orjson for fast JSON serialization
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Every format export_data can write
+EXPORT_FORMATS = ('csv', 'excel', 'database', 'json')
+
 class DataExporter:
-    def __init__(self, output_dir=None):
+    def __init__(self, output_dir=None, db_manager=None):
         self.output_dir = output_dir or Config.OUTPUT_DIR
+        # Optional shared DatabaseManager; the caller stays responsible for closing it
+        self.db_manager = db_manager
         self.ensure_output_directory()
     
     def ensure_output_directory(self):
@@ -16,21 +31,35 @@ class DataExporter:
         if not os.path.exists(self.output_dir):
             os.makedirs(self.output_dir)
     
-    def export_data(self, data, filename_prefix="scrap_centers"):
-        """Export data in the configured format(s)"""
+    def export_data(self, data, filename_prefix="scrap_centers", formats=None):
+        """Export data in the given formats, or the configured format(s) by default"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        if Config.OUTPUT_FORMAT in ['csv', 'both']:
-            self.export_to_csv(data, f"{filename_prefix}_{timestamp}.csv")
+        if formats is None:
+            # Always export as JSON for backup
+            formats = EXPORT_FORMATS if Config.OUTPUT_FORMAT in ['both', 'all'] else (Config.OUTPUT_FORMAT, 'json')
+        
+        writers = []
+        if 'csv' in formats:
+            writers.append((self.export_to_csv, (data, f"{filename_prefix}_{timestamp}.csv")))
         
-        if Config.OUTPUT_FORMAT in ['excel', 'both']:
-            self.export_to_excel(data, f"{filename_prefix}_{timestamp}.xlsx")
+        if 'excel' in formats:
+            writers.append((self.export_to_excel, (data, f"{filename_prefix}_{timestamp}.xlsx")))
         
-        if Config.OUTPUT_FORMAT in ['database', 'both']:
-            self.export_to_database(data)
+        if 'json' in formats:
+            writers.append((self.export_to_json, (data, f"{filename_prefix}_{timestamp}.json")))
         
-        # Always export as JSON for backup
-        self.export_to_json(data, f"{filename_prefix}_{timestamp}.json")
+        # Each file writer has its own file, so they run side by side on the pool. The database
+        # writer stays on the calling thread, which owns the session of an injected db_manager
+        with ThreadPoolExecutor(max_workers=max(len(writers), 1)) as executor:
+            futures = [executor.submit(writer, *args) for writer, args in writers]
+            
+            if 'database' in formats:
+                self.export_to_database(data)
+        
+        # Surface the first file writer failure, as the sequential version did
+        for future in futures:
+            future.result()
     
     def export_to_csv(self, data, filename):
         """Export data to CSV file"""
@@ -43,11 +72,14 @@ class DataExporter:
         # Flatten nested data
         flattened_data = self._flatten_data(data)
         
-        # Create DataFrame
-        df = pd.DataFrame(flattened_data)
+        # Columns in first-seen order, same layout a DataFrame would give
+        columns = list(dict.fromkeys(key for item in flattened_data for key in item))
         
-        # Export to CSV
-        df.to_csv(filepath, index=False, encoding='utf-8')
+        # Stream rows straight to the file; csv.writer quotes only the fields that need it
+        with open(filepath, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(columns)
+            writer.writerows([item.get(column) for column in columns] for item in flattened_data)
         print(f"Data exported to CSV: {filepath}")
     
     def export_to_excel(self, data, filename):
@@ -82,9 +114,8 @@ class DataExporter:
             })
             
             # Write headers with formatting
-            for col_num, value in enumerate(df.columns.values):
-                worksheet.write(0, col_num, value, header_format)
-                worksheet.set_column(col_num, col_num, 20)  # Set column width
+            worksheet.write_row(0, 0, df.columns, header_format)
+            worksheet.set_column(0, len(df.columns) - 1, 20)  # Set column width
         
         print(f"Data exported to Excel: {filepath}")
     
@@ -92,14 +123,18 @@ class DataExporter:
         """Export data to JSON file"""
         filepath = os.path.join(self.output_dir, filename)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        if HAS_ORJSON:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
         
         print(f"Data exported to JSON: {filepath}")
     
     def export_to_database(self, data):
         """Export data to database"""
-        db_manager = DatabaseManager(Config.DATABASE_URL)
+        db_manager = self.db_manager or DatabaseManager(Config.DATABASE_URL)
         
         try:
             for center_data in data:
@@ -110,10 +145,12 @@ class DataExporter:
                 center = db_manager.add_scrap_center(db_center_data)
                 
                 if center and center_data.get('materials'):
-                    # Add materials
+                    # Add materials, checking links against a set of ids instead of the relationship list
+                    linked_ids = {material.id for material in center.materials}
                     for material_name in center_data['materials']:
                         material = db_manager.get_or_create_material(material_name)
-                        if material not in center.materials:
+                        if material.id not in linked_ids:
+                            linked_ids.add(material.id)
                             center.materials.append(material)
                 
                 # Add prices if available
@@ -125,32 +162,36 @@ class DataExporter:
                             price_data
                         )
             
+            # Commit the material links of the last center, nothing after it flushes them
+            db_manager.session.commit()
+            
             print(f"Data exported to database: {Config.DATABASE_URL}")
             
         finally:
-            db_manager.close()
+            if db_manager is not self.db_manager:
+                db_manager.close()
     
     def _flatten_data(self, data):
         """Flatten nested data for CSV/Excel export"""
-        flattened = []
+        # Built in one comprehension, the output length is known up front
+        return [self._flatten_item(item) for item in data]
+    
+    def _flatten_item(self, item):
+        """Flatten a single record"""
+        flat_item = {}
         
-        for item in data:
-            flat_item = {}
-            
-            for key, value in item.items():
-                if isinstance(value, dict):
-                    # Flatten dictionary fields (like working_hours)
-                    for sub_key, sub_value in value.items():
-                        flat_item[f"{key}_{sub_key}"] = sub_value
-                elif isinstance(value, list):
-                    # Convert lists to comma-separated strings
-                    flat_item[key] = ', '.join(str(v) for v in value)
-                else:
-                    flat_item[key] = value
-            
-            flattened.append(flat_item)
+        for key, value in item.items():
+            if isinstance(value, dict):
+                # Flatten dictionary fields (like working_hours)
+                for sub_key, sub_value in value.items():
+                    flat_item[f"{key}_{sub_key}"] = sub_value
+            elif isinstance(value, list):
+                # Convert lists to comma-separated strings
+                flat_item[key] = ', '.join(map(str, value))
+            else:
+                flat_item[key] = value
         
-        return flattened
+        return flat_item
     
     def _prepare_center_for_db(self, center_data):
         """Prepare center data for database insertion"""
@@ -214,20 +255,10 @@ def create_summary_report(data, output_dir=None):
     centers_with_coordinates = sum(1 for item in data if item.get('latitude') and item.get('longitude'))
     
     # Count by country
-    countries = {}
-    for item in data:
-        country = item.get('country', 'Unknown')
-        countries[country] = countries.get(country, 0) + 1
+    countries = Counter(item.get('country', 'Unknown') for item in data)
     
     # Count materials
-    all_materials = []
-    for item in data:
-        if item.get('materials'):
-            all_materials.extend(item['materials'])
-    
-    material_counts = {}
-    for material in all_materials:
-        material_counts[material] = material_counts.get(material, 0) + 1
+    material_counts = Counter(chain.from_iterable(item.get('materials') or () for item in data))
     
     # Write report
     with open(filepath, 'w', encoding='utf-8') as f:
@@ -244,12 +275,12 @@ def create_summary_report(data, output_dir=None):
         f.write(f"Centers with Coordinates: {centers_with_coordinates} ({centers_with_coordinates/total_centers*100:.1f}%)\n\n")
         
         f.write("DISTRIBUTION BY COUNTRY:\n")
-        for country, count in sorted(countries.items(), key=lambda x: x[1], reverse=True):
+        for country, count in countries.most_common():
             f.write(f"{country}: {count} centers\n")
         f.write("\n")
         
         f.write("TOP MATERIALS HANDLED:\n")
-        for material, count in sorted(material_counts.items(), key=lambda x: x[1], reverse=True)[:20]:
+        for material, count in material_counts.most_common(20):
             f.write(f"{material}: {count} centers\n")
     
     print(f"Summary report created: {filepath}") 
\ No newline at end of file
@@ -11,16 +11,76 @@ import time
 import random
 import logging
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 from datetime import datetime
 import pandas as pd
 from urllib.parse import quote_plus, urljoin
 import re
+import xxhash
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+# Optional: Aho-Corasick automaton for single-pass keyword matching
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
 class EnhancedMetalScraper:
+    # Patterns compiled once for every page the scraper reads
+    _PATTERNS = {
+        'phone_chars': re.compile(r'[^\d+]'),
+        'phone': tuple(re.compile(p) for p in (
+            r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
+            r'1[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
+        )),
+        'email': re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
+        'hours': tuple(re.compile(p, re.IGNORECASE | re.DOTALL) for p in (
+            r'mon.*?fri.*?\d{1,2}:\d{2}.*?\d{1,2}:\d{2}',
+            r'monday.*?friday.*?\d{1,2}:\d{2}.*?\d{1,2}:\d{2}',
+            r'hours.*?\d{1,2}:\d{2}.*?\d{1,2}:\d{2}',
+            r'open.*?\d{1,2}:\d{2}.*?\d{1,2}:\d{2}'
+        )),
+        # Enhanced price patterns
+        'price': tuple(re.compile(p, re.IGNORECASE) for p in (
+            r'\$\d+\.?\d*\s*per\s*pound',
+            r'\$\d+\.?\d*\s*/\s*lb',
+            r'\$\d+\.?\d*\s*per\s*ton',
+            r'copper.*?\$\d+\.?\d*',
+            r'aluminum.*?\$\d+\.?\d*',
+            r'steel.*?\$\d+\.?\d*',
+            r'brass.*?\$\d+\.?\d*',
+            r'current\s*price.*?\$\d+\.?\d*',
+            r'market\s*price.*?\$\d+\.?\d*'
+        ))
+    }
+
     def __init__(self):
         self.session = requests.Session()
+        # Own generator for request jitter instead of the shared module-level one
+        self._rng = random.Random()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.9',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive'
+        })
+        
+        # Keep-alive pools sized for the worker threads; urllib3 retries rate limits and server errors
+        # with backoff (honouring Retry-After). Overpass queries are POSTs, so POST is retried too.
+        retry = Retry(
+            total=3,
+            backoff_factor=1.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(['GET', 'POST']),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=16, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.results = []
         self.logger = self._setup_logging()
         
@@ -43,6 +103,12 @@ class EnhancedMetalScraper:
             'cast_iron': ['cast iron', 'чугун', 'cast', 'machine parts'],
             'titanium': ['titanium', 'титан', 'ti', 'aerospace grade']
         }
+        self._metal_matcher = self._build_keyword_matcher(self.metal_types)
+        # Lowercased once for the fallback substring scans
+        self._metal_keywords_lower = {
+            metal_category: [keyword.lower() for keyword in keywords]
+            for metal_category, keywords in self.metal_types.items()
+        }
         
         # Services to look for
         self.services = [
@@ -51,6 +117,24 @@ class EnhancedMetalScraper:
             'industrial cleanup', 'auto dismantling', 'certified scales',
             'commercial accounts', 'residential pickup', 'same day pickup'
         ]
+        self._service_matcher = self._build_keyword_matcher({service: [service] for service in self.services})
+        self._services_lower = [(service, service.lower()) for service in self.services]
+
+    def _build_keyword_matcher(self, keyword_groups):
+        """Automaton mapping each lowercased keyword to the labels it belongs to, or None without pyahocorasick"""
+        if not HAS_AHOCORASICK:
+            return None
+        
+        keyword_labels = {}
+        for label, keywords in keyword_groups.items():
+            for keyword in keywords:
+                keyword_labels.setdefault(keyword.lower(), []).append(label)
+        
+        matcher = ahocorasick.Automaton()
+        for keyword, labels in keyword_labels.items():
+            matcher.add_word(keyword, tuple(labels))
+        matcher.make_automaton()
+        return matcher
 
     def _setup_logging(self):
         logger = logging.getLogger('EnhancedMetalScraper')
@@ -130,36 +214,58 @@ class EnhancedMetalScraper:
                 "47.40,-122.50,47.70,-122.10"  # Seattle, WA
             ]
             
-            for i, bbox in enumerate(bboxes):
-                try:
-                    self.logger.info(f"📡 Searching region {i+1}/{len(bboxes)}: {bbox}")
-                    bbox_query = query.replace("(bbox)", f"({bbox})")
-                    
-                    response = self._make_safe_request(base_url, data=bbox_query, method='POST')
-                    if response and response.status_code == 200:
-                        data = response.json()
-                        businesses = self._parse_enhanced_overpass_results(data)
-                        results.extend(businesses)
-                        self.logger.info(f"✅ Found {len(businesses)} businesses in region {i+1}")
-                    
-                    # Rate limiting
-                    time.sleep(random.uniform(3, 6))
+            # Query regions two at a time: the public Overpass instance only grants a couple of slots per client
+            region_results = {}
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = {
+                    executor.submit(self._query_overpass_region, base_url, query, bbox, i, len(bboxes)): i
+                    for i, bbox in enumerate(bboxes)
+                }
+                for future in as_completed(futures):
+                    region_results[futures[future]] = future.result()
                     
-                    if len(results) >= target_count:
+                    if sum(len(businesses) for businesses in region_results.values()) >= target_count:
+                        # Regions that haven't started yet are dropped
+                        for pending in futures:
+                            pending.cancel()
                         break
-                    
-                except Exception as e:
-                    self.logger.warning(f"❌ Error in region {i+1}: {e}")
-                    continue
-                    
+            
+            # Keep region order so duplicate removal stays deterministic
+            for i in sorted(region_results):
+                results.extend(region_results[i])
+        
         except Exception as e:
             self.logger.error(f"Enhanced Overpass API error: {e}")
         
         return self._remove_duplicates(results)
 
+    def _query_overpass_region(self, base_url, query, bbox, index, total):
+        """Run the Overpass query for one bounding box"""
+        try:
+            self.logger.info(f"📡 Searching region {index+1}/{total}: {bbox}")
+            bbox_query = query.replace("(bbox)", f"({bbox})")
+            
+            businesses = []
+            response = self._make_safe_request(base_url, data=bbox_query, method='POST')
+            if response and response.status_code == 200:
+                data = response.json()
+                businesses = self._parse_enhanced_overpass_results(data)
+                self.logger.info(f"✅ Found {len(businesses)} businesses in region {index+1}")
+            
+            # Rate limiting
+            time.sleep(self._rng.uniform(3, 6))
+            
+            return businesses
+            
+        except Exception as e:
+            self.logger.warning(f"❌ Error in region {index+1}: {e}")
+            return []
+
     def _parse_enhanced_overpass_results(self, data):
         """Parse OpenStreetMap results with enhanced detail extraction"""
         businesses = []
+        # One timestamp for the whole batch of elements
+        scraped_at = datetime.now().isoformat()
         
         try:
             if 'elements' in data:
@@ -210,7 +316,7 @@ class EnhancedMetalScraper:
                         'source': 'OpenStreetMap Enhanced',
                         'osm_id': str(element.get('id', '')),
                         'osm_type': element.get('type', ''),
-                        'scraped_at': datetime.now().isoformat()
+                        'scraped_at': scraped_at
                     }
                     
                     # Initial metal type detection from tags
@@ -246,7 +352,7 @@ class EnhancedMetalScraper:
             return ''
         
         # Remove non-digit characters except + at the beginning
-        cleaned = re.sub(r'[^\d+]', '', phone)
+        cleaned = self._PATTERNS['phone_chars'].sub('', phone)
         
         # Format US numbers
         if len(cleaned) == 10:
@@ -258,8 +364,6 @@ class EnhancedMetalScraper:
 
     def _detect_metals_from_tags(self, tags):
         """Detect metal types from OSM tags"""
-        detected_metals = []
-        
         # Combine all relevant tag values
         text_to_search = ' '.join([
             tags.get('name', ''),
@@ -270,18 +374,10 @@ class EnhancedMetalScraper:
             tags.get('craft', '')
         ]).lower()
         
-        for metal_category, keywords in self.metal_types.items():
-            for keyword in keywords:
-                if keyword.lower() in text_to_search:
-                    detected_metals.append(metal_category)
-                    break
-        
-        return list(set(detected_metals))
+        return self._extract_metals_from_text(text_to_search)
 
     def _detect_services_from_tags(self, tags):
         """Detect services from OSM tags"""
-        detected_services = []
-        
         # Combine all relevant tag values
         text_to_search = ' '.join([
             tags.get('name', ''),
@@ -290,59 +386,58 @@ class EnhancedMetalScraper:
             tags.get('amenity', '')
         ]).lower()
         
-        for service in self.services:
-            if service.lower() in text_to_search:
-                detected_services.append(service)
-        
-        return detected_services
+        return self._extract_services_from_text(text_to_search)
 
     def _enhance_business_details(self, businesses):
         """Enhance each business with detailed information from web sources"""
-        enhanced_businesses = []
+        # Only the first 50 businesses are enhanced
+        businesses = businesses[:50]
         
         self.logger.info(f"🔬 Enhancing {len(businesses)} businesses with web data...")
         
-        for i, business in enumerate(businesses):
-            try:
-                self.logger.info(f"🔍 Enhancing {i+1}/{len(businesses)}: {business['name']}")
-                
-                enhanced = business.copy()
-                
-                # Try to find and scrape website
-                if not enhanced.get('website'):
-                    enhanced['website'] = self._find_business_website(enhanced)
-                
-                # Scrape website for detailed information
-                if enhanced.get('website'):
-                    website_details = self._scrape_business_website(enhanced['website'], enhanced['name'])
-                    enhanced.update(website_details)
-                
-                # Enhanced metal type detection
-                enhanced['metal_types'] = self._extract_comprehensive_metals(enhanced)
-                enhanced['services'] = self._extract_comprehensive_services(enhanced)
-                enhanced['pricing_info'] = self._extract_pricing_info(enhanced)
-                enhanced['contact_details'] = self._extract_contact_details(enhanced)
-                
-                # Add data quality metrics
-                enhanced['data_completeness'] = self._calculate_completeness_score(enhanced)
-                enhanced['metal_info_quality'] = len(enhanced['metal_types']) > 0
-                enhanced['contact_completeness'] = self._calculate_contact_completeness(enhanced)
-                
-                enhanced_businesses.append(enhanced)
-                
-                # Rate limiting
-                time.sleep(random.uniform(2, 4))
-                
-                # Break if we have enough high-quality results
-                if len(enhanced_businesses) >= 50:
-                    break
-                
-            except Exception as e:
-                self.logger.warning(f"❌ Error enhancing {business.get('name', 'Unknown')}: {e}")
-                enhanced_businesses.append(business)
-                continue
+        # Website lookups are network-bound, so several businesses are enhanced at once
+        total = len(businesses)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(self._enhance_business, business, i, total) for i, business in enumerate(businesses)]
         
-        return enhanced_businesses
+        # Results keep the input order
+        return [future.result() for future in futures]
+
+    def _enhance_business(self, business, index, total):
+        """Enhance a single business, falling back to the original data on errors"""
+        try:
+            self.logger.info(f"🔍 Enhancing {index+1}/{total}: {business['name']}")
+            
+            enhanced = business.copy()
+            
+            # Try to find and scrape website
+            if not enhanced.get('website'):
+                enhanced['website'] = self._find_business_website(enhanced)
+            
+            # Scrape website for detailed information
+            if enhanced.get('website'):
+                website_details = self._scrape_business_website(enhanced['website'], enhanced['name'])
+                enhanced.update(website_details)
+            
+            # Enhanced metal type detection
+            enhanced['metal_types'] = self._extract_comprehensive_metals(enhanced)
+            enhanced['services'] = self._extract_comprehensive_services(enhanced)
+            enhanced['pricing_info'] = self._extract_pricing_info(enhanced)
+            enhanced['contact_details'] = self._extract_contact_details(enhanced)
+            
+            # Add data quality metrics
+            enhanced['data_completeness'] = self._calculate_completeness_score(enhanced)
+            enhanced['metal_info_quality'] = len(enhanced['metal_types']) > 0
+            enhanced['contact_completeness'] = self._calculate_contact_completeness(enhanced)
+            
+            # Rate limiting
+            time.sleep(self._rng.uniform(2, 4))
+            
+            return enhanced
+            
+        except Exception as e:
+            self.logger.warning(f"❌ Error enhancing {business.get('name', 'Unknown')}: {e}")
+            return business
 
     def _find_business_website(self, business):
         """Try to find business website using search"""
@@ -361,7 +456,7 @@ class EnhancedMetalScraper:
             
             response = self._make_safe_request(search_url)
             if response and response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = BeautifulSoup(response.content, 'lxml')
                 
                 # Look for website links in search results
                 links = soup.find_all('a', href=True)
@@ -387,8 +482,10 @@ class EnhancedMetalScraper:
             if not response or response.status_code != 200:
                 return details
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            text_content = soup.get_text().lower()
+            tree = LexborHTMLParser(response.text)
+            # Drop code blocks so the text matches what a reader sees (BeautifulSoup's get_text skips them too)
+            tree.strip_tags(['script', 'style', 'template'])
+            text_content = tree.text().lower()
             
             # Extract various types of information
             details['phone_website'] = self._extract_phone_from_text(text_content)
@@ -397,7 +494,7 @@ class EnhancedMetalScraper:
             details['metals_accepted_website'] = self._extract_metals_from_text(text_content)
             details['pricing_website'] = self._extract_pricing_from_text(text_content)
             details['services_website'] = self._extract_services_from_text(text_content)
-            details['description_website'] = self._extract_business_description(soup)
+            details['description_website'] = self._extract_business_description(tree)
             
             self.logger.info(f"✅ Website scraped for {business_name}")
             
@@ -408,13 +505,16 @@ class EnhancedMetalScraper:
 
     def _extract_metals_from_text(self, text):
         """Extract metal types from website text"""
+        # One pass over the text finds every keyword occurrence, overlapping ones included,
+        # so this matches the substring checks below
+        if self._metal_matcher is not None:
+            return list({category for _, categories in self._metal_matcher.iter(text) for category in categories})
+        
         found_metals = []
         
-        for metal_category, keywords in self.metal_types.items():
-            for keyword in keywords:
-                if keyword.lower() in text:
-                    found_metals.append(metal_category)
-                    break
+        for metal_category, keywords in self._metal_keywords_lower.items():
+            if any(keyword in text for keyword in keywords):
+                found_metals.append(metal_category)
         
         return list(set(found_metals))
 
@@ -422,87 +522,59 @@ class EnhancedMetalScraper:
         """Extract pricing information from text"""
         pricing_info = []
         
-        # Enhanced price patterns
-        price_patterns = [
-            r'\$\d+\.?\d*\s*per\s*pound',
-            r'\$\d+\.?\d*\s*/\s*lb',
-            r'\$\d+\.?\d*\s*per\s*ton',
-            r'copper.*?\$\d+\.?\d*',
-            r'aluminum.*?\$\d+\.?\d*',
-            r'steel.*?\$\d+\.?\d*',
-            r'brass.*?\$\d+\.?\d*',
-            r'current\s*price.*?\$\d+\.?\d*',
-            r'market\s*price.*?\$\d+\.?\d*'
-        ]
-        
-        for pattern in price_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            pricing_info.extend(matches)
+        for pattern in self._PATTERNS['price']:
+            pricing_info.extend(pattern.findall(text))
         
         return pricing_info[:10]  # Limit results
 
     def _extract_services_from_text(self, text):
         """Extract services from text"""
-        found_services = []
-        
-        for service in self.services:
-            if service.lower() in text:
-                found_services.append(service)
+        if self._service_matcher is not None:
+            matched = {service for _, services in self._service_matcher.iter(text) for service in services}
+            # Same order as self.services, like the fallback scan below
+            return [service for service in self.services if service in matched]
         
-        return found_services
+        return [service for service, service_lower in self._services_lower if service_lower in text]
 
     def _extract_phone_from_text(self, text):
         """Extract phone numbers from text"""
-        phone_patterns = [
-            r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
-            r'1[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-        ]
-        
-        for pattern in phone_patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                return self._clean_phone(matches[0])
+        for pattern in self._PATTERNS['phone']:
+            match = pattern.search(text)
+            if match:
+                return self._clean_phone(match.group())
         
         return ""
 
     def _extract_email_from_text(self, text):
         """Extract email addresses from text"""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        matches = re.findall(email_pattern, text)
-        return matches[0] if matches else ""
+        match = self._PATTERNS['email'].search(text)
+        return match.group() if match else ""
 
     def _extract_hours_from_text(self, text):
         """Extract business hours from text"""
-        hour_patterns = [
-            r'mon.*?fri.*?\d{1,2}:\d{2}.*?\d{1,2}:\d{2}',
-            r'monday.*?friday.*?\d{1,2}:\d{2}.*?\d{1,2}:\d{2}',
-            r'hours.*?\d{1,2}:\d{2}.*?\d{1,2}:\d{2}',
-            r'open.*?\d{1,2}:\d{2}.*?\d{1,2}:\d{2}'
-        ]
-        
-        for pattern in hour_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE | re.DOTALL)
-            if matches:
-                return matches[0][:100]  # Limit length
+        for pattern in self._PATTERNS['hours']:
+            match = pattern.search(text)
+            if match:
+                return match.group()[:100]  # Limit length
         
         return ""
 
-    def _extract_business_description(self, soup):
+    def _extract_business_description(self, tree):
         """Extract business description from website"""
         # Look for description in meta tags or specific sections
         description_sources = [
-            soup.find('meta', {'name': 'description'}),
-            soup.find('meta', {'property': 'og:description'}),
-            soup.find('div', class_=re.compile(r'about|description|overview')),
-            soup.find('section', class_=re.compile(r'about|description|overview'))
+            tree.css_first('meta[name="description"]'),
+            tree.css_first('meta[property="og:description"]'),
+            tree.css_first('div[class*=about], div[class*=description], div[class*=overview]'),
+            tree.css_first('section[class*=about], section[class*=description], section[class*=overview]')
         ]
         
         for source in description_sources:
             if source:
-                if source.name == 'meta':
-                    content = source.get('content', '')
+                if source.tag == 'meta':
+                    content = source.attributes.get('content') or ''
                 else:
-                    content = source.get_text(strip=True)
+                    content = source.text(strip=True)
                 
                 if content and len(content) > 50:
                     return content[:500]  # Limit length
@@ -610,39 +682,24 @@ class EnhancedMetalScraper:
         filled_contacts = sum(1 for field in contact_fields if business.get(field))
         return int((filled_contacts / len(contact_fields)) * 100)
 
-    def _make_safe_request(self, url, params=None, data=None, method='GET', max_retries=3):
+    def _make_safe_request(self, url, params=None, data=None, method='GET'):
         """Make HTTP request with proper error handling"""
-        for attempt in range(max_retries):
-            try:
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Accept-Encoding': 'gzip, deflate',
-                    'Connection': 'keep-alive'
-                }
-                
-                # Rate limiting
-                time.sleep(random.uniform(1, 3))
-                
-                if method == 'POST':
-                    response = self.session.post(url, headers=headers, data=data, timeout=30)
-                else:
-                    response = self.session.get(url, headers=headers, params=params, timeout=30)
-                
-                if response.status_code == 200:
-                    return response
-                elif response.status_code == 429:
-                    wait_time = (attempt + 1) * 10
-                    self.logger.warning(f"Rate limited, waiting {wait_time}s")
-                    time.sleep(wait_time)
-                else:
-                    self.logger.warning(f"HTTP {response.status_code} for {url}")
-                    
-            except Exception as e:
-                self.logger.warning(f"Request error (attempt {attempt + 1}): {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(random.uniform(2, 5))
+        try:
+            # Rate limiting
+            time.sleep(self._rng.uniform(1, 3))
+            
+            if method == 'POST':
+                response = self.session.post(url, data=data, timeout=30)
+            else:
+                response = self.session.get(url, params=params, timeout=30)
+            
+            if response.status_code == 200:
+                return response
+            
+            self.logger.warning(f"HTTP {response.status_code} for {url}")
+            
+        except Exception as e:
+            self.logger.warning(f"Request error for {url}: {e}")
         
         return None
 
@@ -654,10 +711,14 @@ class EnhancedMetalScraper:
         for item in data:
             # Create a unique key based on name and approximate location
             name_key = item['name'].lower().strip()
+            if len(name_key) <= 3:
+                continue
+            
             location_key = f"{item.get('city', '')}{item.get('state', '')}"
-            combined_key = f"{name_key}|{location_key}"
+            # Keep a fixed-size 128-bit hash instead of the full key string
+            combined_key = xxhash.xxh3_128_intdigest(f"{name_key}|{location_key}".encode())
             
-            if combined_key not in seen and len(name_key) > 3:
+            if combined_key not in seen:
                 seen.add(combined_key)
                 unique_data.append(item)
         
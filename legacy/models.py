@@ -1,11 +1,32 @@
-from sqlalchemy import create_engine, Column, Integer, String, Text, Float, DateTime, Boolean, ForeignKey, Table
+from sqlalchemy import create_engine, event, Column, Integer, String, Text, Float, DateTime, Boolean, ForeignKey, Table
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.orm import sessionmaker, relationship, selectinload
+from sqlalchemy.dialects import postgresql, sqlite
 from datetime import datetime
 import json
 
 Base = declarative_base()
 
+# SQLite settings applied to every new connection: WAL lets readers work alongside the writer
+# and, with synchronous=NORMAL, avoids an fsync on every commit
+SQLITE_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY'
+)
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+# Dialects whose INSERT supports ON CONFLICT DO NOTHING
+UPSERT_INSERTS = {
+    'sqlite': sqlite.insert,
+    'postgresql': postgresql.insert
+}
+
 # Association table for many-to-many relationship between centers and materials
 center_materials = Table(
     'center_materials',
@@ -142,6 +163,8 @@ class MaterialPrice(Base):
 class DatabaseManager:
     def __init__(self, database_url):
         self.engine = create_engine(database_url)
+        if self.engine.dialect.name == 'sqlite':
+            event.listen(self.engine, 'connect', _set_sqlite_pragmas)
         Base.metadata.create_all(self.engine)
         Session = sessionmaker(bind=self.engine)
         self.session = Session()
@@ -158,6 +181,67 @@ class DatabaseManager:
             print(f"Error adding scrap center: {e}")
             return None
     
+    def bulk_add_centers(self, centers_data):
+        """Add many scrap centers and their material links in one transaction"""
+        center_columns = set(ScrapCenter.__table__.columns.keys()) - {'id'}
+        json_columns = {'working_hours', 'services_offered'}
+        
+        rows = []
+        for center_data in centers_data:
+            row = {key: value for key, value in center_data.items() if key in center_columns}
+            for key in json_columns & row.keys():
+                if not isinstance(row[key], str):
+                    row[key] = json.dumps(row[key])
+            rows.append(row)
+        
+        try:
+            # return_defaults fills in the new primary keys for the association rows
+            self.session.bulk_insert_mappings(ScrapCenter, rows, return_defaults=True)
+            
+            material_names = {name for center_data in centers_data for name in center_data.get('materials') or ()}
+            material_ids = self.get_or_create_materials(material_names)
+            
+            links = [
+                {'center_id': row['id'], 'material_id': material_id}
+                for row, center_data in zip(rows, centers_data)
+                for material_id in dict.fromkeys(material_ids[name] for name in center_data.get('materials') or ())
+            ]
+            if links:
+                self.session.execute(center_materials.insert(), links)
+            
+            self.session.commit()
+            return [row['id'] for row in rows]
+        except Exception as e:
+            self.session.rollback()
+            print(f"Error adding scrap centers: {e}")
+            return []
+    
+    def get_or_create_materials(self, material_names):
+        """Return a name -> id mapping, creating the materials that don't exist yet"""
+        if not material_names:
+            return {}
+        
+        upsert_insert = UPSERT_INSERTS.get(self.engine.dialect.name)
+        if upsert_insert is not None:
+            # One INSERT for the whole batch; names that already exist are skipped by the database
+            self.session.execute(
+                upsert_insert(Material)
+                .values([{'name': name} for name in material_names])
+                .on_conflict_do_nothing(index_elements=['name'])
+            )
+            return dict(
+                self.session.query(Material.name, Material.id).filter(Material.name.in_(material_names))
+            )
+        
+        material_ids = dict(
+            self.session.query(Material.name, Material.id).filter(Material.name.in_(material_names))
+        )
+        missing = [{'name': name} for name in material_names if name not in material_ids]
+        if missing:
+            self.session.bulk_insert_mappings(Material, missing, return_defaults=True)
+            material_ids.update((row['name'], row['id']) for row in missing)
+        return material_ids
+    
     def get_or_create_material(self, material_name, category=None):
         """Get existing material or create new one"""
         material = self.session.query(Material).filter_by(name=material_name).first()
@@ -186,7 +270,8 @@ class DatabaseManager:
     
     def get_all_centers(self):
         """Get all scrap centers"""
-        return self.session.query(ScrapCenter).all()
+        # Load every center's materials in one IN query instead of one lazy load per center
+        return self.session.query(ScrapCenter).options(selectinload(ScrapCenter.materials)).all()
     
     def close(self):
         """Close database session"""
@@ -5,16 +5,17 @@ Test script for simplified phone/email extraction methods
 
 import sys
 import os
+import time
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from accurate_scraper import USMetalScraper
+from accurate_scraper import AIEnhancedMetalScraper
 
 def test_simple_extraction():
     """Test simplified extraction methods"""
     print("🧪 TESTING SIMPLIFIED EXTRACTION METHODS")
     print("=" * 60)
     
-    scraper = USMetalScraper()
+    scraper = AIEnhancedMetalScraper()
     
     # Test phone extraction
     print("\n📞 Testing Phone Extraction:")
@@ -78,5 +79,29 @@ def test_simple_extraction():
     print("\n✅ Simple extraction test completed!")
     print("✅ Methods are working correctly!")
 
+def test_pathological_page_text():
+    """Test that whole-page scans stay linear on long digit runs"""
+    print("\n⏱️  TESTING WHOLE-PAGE SCANS ON DIGIT RUNS")
+    print("=" * 60)
+    
+    patterns = AIEnhancedMetalScraper._PATTERNS
+    scans = patterns['address'] + patterns['email'] + patterns['city'] + (
+        patterns['email_any'], patterns['email_simple'])
+    
+    timings = {}
+    for size in (12000, 48000):
+        page_text = ('12345 ' * size)[:size]
+        start = time.perf_counter()
+        for pattern in scans:
+            pattern.findall(page_text)
+        timings[size] = time.perf_counter() - start
+        print(f"{size // 1000} KB digit run → {timings[size]:.3f}s")
+    
+    # 4x the text should cost about 4x the time; a quadratic scan costs 16x
+    assert timings[48000] < 2.0, "whole-page scan too slow on a 48 KB digit run"
+    assert timings[48000] < 8 * max(timings[12000], 0.01), "whole-page scan grows faster than linear"
+    print("✅ Whole-page scans stay linear!")
+
 if __name__ == "__main__":
-    test_simple_extraction() 
\ No newline at end of file
+    test_simple_extraction()
+    test_pathological_page_text() 
\ No newline at end of file
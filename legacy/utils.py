@@ -11,6 +11,28 @@ import googlemaps
 from fake_useragent import UserAgent
 from config import Config
 
+# Optional: Aho-Corasick automaton for single-pass material matching
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+
+def _build_material_matcher():
+    """Automaton over the lowercased Config.MATERIAL_TYPES, or None without pyahocorasick"""
+    if not HAS_AHOCORASICK:
+        return None
+    
+    matcher = ahocorasick.Automaton()
+    for material in Config.MATERIAL_TYPES:
+        matcher.add_word(material.lower(), material)
+    matcher.make_automaton()
+    return matcher
+
+
+MATERIAL_MATCHER = _build_material_matcher()
+
 class DataProcessor:
     def __init__(self):
         self.ua = UserAgent()
@@ -219,9 +241,14 @@ class DataProcessor:
         text_lower = text.lower()
         found_materials = []
         
-        for material in Config.MATERIAL_TYPES:
-            if material.lower() in text_lower:
-                found_materials.append(material)
+        if MATERIAL_MATCHER is not None:
+            # One pass over the text for all materials, reported in config order
+            matched = {material for _, material in MATERIAL_MATCHER.iter(text_lower)}
+            found_materials = [material for material in Config.MATERIAL_TYPES if material in matched]
+        else:
+            for material in Config.MATERIAL_TYPES:
+                if material.lower() in text_lower:
+                    found_materials.append(material)
         
         # Additional material detection patterns
         metal_patterns = [